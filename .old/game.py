@@ -2,24 +2,62 @@
 
 import asyncio
 import websockets
-import uuid
-import json
+try:
+    import orjson
+    dumps, loads = orjson.dumps, orjson.loads
+except ImportError:  # fall back to the stdlib codec
+    import json
+    loads = json.loads
+    _encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def dumps(obj):
+        # Match orjson: compact, and bytes so frames go out as binary like the server's
+        return _encode(obj).encode()
 import logging
+import logging.handlers
+import atexit
+import queue
 import fire
 import random
 
 import pygame
 import sys
+import threading
+import functools
+from collections import OrderedDict
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
 
 from old.server import GameServer
 
+HELP_TEXT = """Available commands:
+  move <destination> - Move to an adjacent room
+  kill <player_id>   - (Impostor only) Kill a player in the same room
+  report            - Report a dead body in your location
+  look              - Display your current location and available exits
+  map               - Display the game map with your current location
+  help              - Show this help message
+  exit/q            - Exit the game
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def encode_action(player_id, action, field=None, value=None):
+    """Encodes an action message; moves, kills and reports repeat, so each is encoded once"""
+    payload = {"action": action}
+    if field is not None:
+        payload[field] = value
+    return dumps({"type": "action", "payload": payload, "player_id": player_id})
+
 class CliGameClient:
     def __init__(self):
         self.player_id = None
         self.location = None
         self.available_exits = []
         self.websocket = None
-        self.setup_logging()
         self.running = True  # Flag to control the main loop
         self.map_template = """
         [cafeteria]---[upper_engine]---[reactor]
@@ -29,19 +67,29 @@ class CliGameClient:
         [storage]---[lower_engine]---[electrical]
         """
         self.game_phase = "free_roam"
-
-    def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[logging.StreamHandler()],
-        )
+        self.input_queue = None  # Lines typed on stdin, fed by read_stdin
+        # Server message type -> handler, instead of an if/elif chain per message
+        self.handlers = {
+            "state": self.on_state,
+            "state_delta": self.on_state_delta,
+            "movement": self.on_movement,
+            "player_update": self.on_player_update,
+            "error": self.on_error,
+            "event": self.on_event,
+            "phase_update": self.on_phase_update,
+            "chat": self.on_chat,
+            "vote_confirmation": self.on_vote_confirmation,
+        }
 
     async def connect(self):
         uri = "ws://localhost:8765"
-        async with websockets.connect(uri) as websocket:
+        async with websockets.connect(uri, compression=None) as websocket:
             self.websocket = websocket
             logging.info("Connected to the game server.")
+            # One reader thread for the whole session instead of one executor job per line
+            self.input_queue = asyncio.Queue()
+            loop = asyncio.get_running_loop()
+            threading.Thread(target=self.read_stdin, args=(loop,), daemon=True).start()
             # Start listener and input tasks
             listener_task = asyncio.create_task(self.receive_messages())
             input_task = asyncio.create_task(self.send_commands())
@@ -56,69 +104,94 @@ class CliGameClient:
     async def receive_messages(self):
         try:
             async for message in self.websocket:
-                data = json.loads(message)
-                message_type = data.get("type")
-                if message_type == "state":
-                    self.player_id = data.get("player_id")
-                    payload = data.get("payload")
-                    self.location = payload.get("location")
-                    self.available_exits = payload.get("available_exits")
-                    self.state_data = payload  # Store the complete state data
-                    self.display_current_location()
-                elif message_type == "movement":
-                    payload = data.get("payload")
-                    player = payload.get("player_id")
-                    from_room = payload.get("from")
-                    to_room = payload.get("to")
-                    if player != self.player_id:  # Don't show own movements
-                        print(f"\nPlayer {player} moved from {from_room} to {to_room}")
-                        print("> ", end="", flush=True)  # Restore prompt
-                elif message_type == "player_update":
-                    payload = data.get("payload")
-                    player = payload.get("player_id")
-                    event = payload.get("event")
-                    location = payload.get("location")
-                    if player != self.player_id:
-                        print(f"\nPlayer {player} {event} in {location}")
-                        print("> ", end="", flush=True)  # Restore prompt
-                elif message_type == "error":
-                    payload = data.get("payload")
-                    error_message = payload.get("message")
-                    print(f"Error: {error_message}")
-                elif message_type == "event":
-                    payload = data.get("payload")
-                    event = payload.get("event")
-                    if event == "body_reported":
-                        print(f"\nBody reported by Player {payload.get('reporter')}")
-                        print("> ", end="", flush=True)
-                    elif event == "player_killed":
-                        print(f"\nPlayer {payload.get('victim')} was killed")
-                        print("> ", end="", flush=True)
-                elif message_type == "phase_update":
-                    payload = data.get("payload")
-                    phase = payload.get("phase")
-                    self.game_phase = phase
-                    if phase == "discussion":
-                        print("\n--- Discussion Phase Started ---")
-                    elif phase == "voting":
-                        print("\n--- Voting Phase Started ---")
-                    elif phase == "free_roam":
-                        print("\n--- Free Roam Phase Resumed ---")
-                elif message_type == "chat":
-                    payload = data.get("payload")
-                    player_id = payload.get("player_id")
-                    message_text = payload.get("message")
-                    print(f"\n[Player {player_id[:8]}] says: {message_text}")
-                    print("> ", end="", flush=True)
-                elif message_type == "vote_confirmation":
-                    print("Your vote has been recorded.")
-                else:
-                    print("Received unknown message type.")
+                data = loads(message)
+                # Frames queued close together arrive batched as a list
+                for item in data if isinstance(data, list) else [data]:
+                    handler = self.handlers.get(item["type"])
+                    if handler is None:
+                        print("Received unknown message type.")
+                    else:
+                        handler(item)
         except websockets.exceptions.ConnectionClosed:
             pass  # Handle the connection being closed
         finally:
             self.running = False  # Stop the input loop
 
+    def on_state(self, data):
+        payload = data["payload"]
+        self.player_id = data["player_id"]
+        self.location = payload["location"]
+        self.available_exits = payload["available_exits"]
+        self.state_data = payload  # Store the complete state data
+        self.display_current_location()
+
+    def on_state_delta(self, data):
+        # Only the fields that changed since the last state are sent
+        if not hasattr(self, "state_data"):
+            return  # The full state was dropped; the server's resync snapshot follows
+        self.state_data.update(data["payload"])
+        self.location = self.state_data["location"]
+        self.available_exits = self.state_data["available_exits"]
+        self.display_current_location()
+
+    def on_movement(self, data):
+        payload = data["payload"]
+        player = payload["player_id"]
+        if player != self.player_id:  # Don't show own movements
+            print(f"\nPlayer {player} moved from {payload['from']} to {payload['to']}")
+            print("> ", end="", flush=True)  # Restore prompt
+
+    def on_player_update(self, data):
+        payload = data["payload"]
+        player = payload["player_id"]
+        if player != self.player_id:
+            print(f"\nPlayer {player} {payload['event']} in {payload['location']}")
+            print("> ", end="", flush=True)  # Restore prompt
+
+    def on_error(self, data):
+        print(f"Error: {data['payload']['message']}")
+
+    def on_event(self, data):
+        payload = data["payload"]
+        event = payload["event"]
+        if event == "body_reported":
+            print(f"\nBody reported by Player {payload['reporter']}")
+            print("> ", end="", flush=True)
+        elif event == "player_killed":
+            print(f"\nPlayer {payload['victim']} was killed")
+            print("> ", end="", flush=True)
+
+    def on_phase_update(self, data):
+        phase = data["payload"]["phase"]
+        self.game_phase = phase
+        if phase == "discussion":
+            print("\n--- Discussion Phase Started ---")
+        elif phase == "voting":
+            print("\n--- Voting Phase Started ---")
+        elif phase == "free_roam":
+            print("\n--- Free Roam Phase Resumed ---")
+
+    def on_chat(self, data):
+        payload = data["payload"]
+        print(f"\n[Player {payload['player_id'][:8]}] says: {payload['message']}")
+        print("> ", end="", flush=True)
+
+    def on_vote_confirmation(self, data):
+        print("Your vote has been recorded.")
+
+    def read_stdin(self, loop):
+        """Blocks on stdin in a daemon thread, handing each line to the event loop."""
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(self.input_queue.put_nowait, line.rstrip("\n"))
+        loop.call_soon_threadsafe(self.input_queue.put_nowait, None)  # EOF
+
+    async def read_line(self, prompt):
+        print(prompt, end="", flush=True)
+        line = await self.input_queue.get()
+        if line is None:
+            raise EOFError
+        return line
+
     def parse_command(self, input_line):
         tokens = input_line.strip().split()
         if not tokens:
@@ -131,14 +204,14 @@ class CliGameClient:
         while self.running:
             if self.game_phase == "discussion":
                 # Accept chat messages
-                input_line = await asyncio.get_event_loop().run_in_executor(None, input, "> ")
+                input_line = await self.read_line("> ")
                 await self.send_chat_command(input_line)
             elif self.game_phase == "voting":
                 # Prompt for voting
-                voted_player_id = await asyncio.get_event_loop().run_in_executor(None, input, "Vote for player ID (or 'skip'): ")
+                voted_player_id = await self.read_line("Vote for player ID (or 'skip'): ")
                 await self.send_vote_command(voted_player_id.strip())
             else:
-                input_line = await asyncio.get_event_loop().run_in_executor(None, input, "> ")
+                input_line = await self.read_line("> ")
                 command, args = self.parse_command(input_line)
                 if command == "move" and args:
                     await self.send_move_command(args[0])
@@ -162,7 +235,7 @@ class CliGameClient:
             "payload": {"action": "chat", "message": message_text},
             "player_id": self.player_id,
         }
-        await self.websocket.send(json.dumps(action_message))
+        await self.websocket.send(dumps(action_message))
 
     async def send_vote_command(self, voted_player_id):
         action_message = {
@@ -170,34 +243,19 @@ class CliGameClient:
             "payload": {"action": "vote", "vote": voted_player_id},
             "player_id": self.player_id,
         }
-        await self.websocket.send(json.dumps(action_message))
+        await self.websocket.send(dumps(action_message))
 
     async def send_move_command(self, destination):
         if self.player_id is None:
             print("You are not connected to the server yet.")
             return
-        action_message = {
-            "type": "action",
-            "payload": {"action": "move", "destination": destination},
-            "player_id": self.player_id,
-        }
-        await self.websocket.send(json.dumps(action_message))
+        await self.websocket.send(encode_action(self.player_id, "move", "destination", destination))
 
     async def send_kill_command(self, target_id):
-        action_message = {
-            "type": "action",
-            "payload": {"action": "kill", "target": target_id},
-            "player_id": self.player_id,
-        }
-        await self.websocket.send(json.dumps(action_message))
+        await self.websocket.send(encode_action(self.player_id, "kill", "target", target_id))
 
     async def send_report_command(self):
-        action_message = {
-            "type": "action",
-            "payload": {"action": "report"},
-            "player_id": self.player_id,
-        }
-        await self.websocket.send(json.dumps(action_message))
+        await self.websocket.send(encode_action(self.player_id, "report"))
 
     async def disconnect(self):
         self.running = False
@@ -209,26 +267,29 @@ class CliGameClient:
             print("Waiting for game state...")
             return
 
-        print(f"\nCurrent Location: {self.location}")
+        # Collect the whole view and write it once rather than one print per line
+        lines = [f"\nCurrent Location: {self.location}"]
         if hasattr(self, "state_data"):
             role = self.state_data.get("role", "Unknown")
             status = self.state_data.get("status", "Unknown")
-            print(f"Role: {role}")
-            print(f"Status: {status}")
+            lines.append(f"Role: {role}")
+            lines.append(f"Status: {status}")
 
             # Show if there are any bodies in the room
             bodies_in_room = self.state_data.get("bodies_in_room", [])
             if bodies_in_room:
-                print("\nDead bodies in this room:")
+                lines.append("\nDead bodies in this room:")
                 for body_id in bodies_in_room:
-                    print(f"  - Body of Player {body_id}")
+                    lines.append(f"  - Body of Player {body_id}")
 
             players_in_room = self.state_data.get("players_in_room", {})
             if players_in_room:
-                print("\nPlayers in this room:")
+                lines.append("\nPlayers in this room:")
                 for pid, data in players_in_room.items():
                     if pid != self.player_id:
-                        print(f"  - Player {pid} ({data['status']})")
+                        lines.append(f"  - Player {pid} ({data['status']})")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def display_map(self):
         if not self.location:
@@ -238,37 +299,46 @@ class CliGameClient:
         highlighted_map = self.map_template.replace(
             f"[{self.location}]", f"[*{self.location}*]"
         )
-        print(highlighted_map)
+        sys.stdout.write(highlighted_map + "\n")
+        sys.stdout.flush()
 
     def display_help(self):
-        print("Available commands:")
-        print("  move <destination> - Move to an adjacent room")
-        print("  kill <player_id>   - (Impostor only) Kill a player in the same room")
-        print("  report            - Report a dead body in your location")
-        print("  look              - Display your current location and available exits")
-        print("  map               - Display the game map with your current location")
-        print("  help              - Show this help message")
-        print("  exit/q            - Exit the game")
+        sys.stdout.write(HELP_TEXT)
+        sys.stdout.flush()
 
 
 class GuiGameClient:
+    # Constants for layout
+    MARGIN = 20
+    TOP_INFO_HEIGHT = 30
+    PLAYERS_BOX_HEIGHT = 220
+    DESTINATIONS_BOX_HEIGHT = 150
+
     def __init__(self):
         self.player_id = None
         self.location = None
         self.available_exits = []
         self.websocket = None
-        self.setup_logging()
         self.running = True
         self.state_data = {}
         self.screen = None
         self.clock = None
         self.font = None
+        self.large_font = None
+        self.text_cache = OrderedDict()  # (text, color, font) -> rendered surface, least recent first
+        self.text_cache_size = 256
+        self.rect_surfaces = {}  # (size, color, border_color, border_width) -> filled surface
+        self.slot_rects = {}  # (grid index, box width) -> (player slot rect, kill button rect)
+        self.exit_layout_key = None  # (exits, screen size) the exit buttons were laid out for
+        self.exit_blits = ([], [])  # Exit button backgrounds and labels, ready for blits
         self.map_structure = self.initialize_map()
         self.room_positions = self.define_room_positions()
         self.selected_player = None  # For selecting players to interact with
         self.show_help = False  # Toggle help display
         self.exit_buttons = {}  # Store button rectangles for click detection
         self.action_buttons = {}  # Store action button rectangles
+        self.player_hit_rects = []  # Player slot rects as last drawn, for click detection
+        self.player_hit_pids = []  # The player shown in each of those slots
         self.bodies_in_room = set()  # Track dead bodies in current room
         self.show_murder_overlay = False
         self.murder_overlay_start = 0
@@ -278,13 +348,8 @@ class GuiGameClient:
         self.chat_input_active = False
         self.vote_options = []
         self.selected_vote = None
-
-    def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[logging.StreamHandler()],
-        )
+        self.background = None  # Static chrome, redrawn only when background_key changes
+        self.background_key = None
 
     def initialize_map(self):
         return {
@@ -315,7 +380,7 @@ class GuiGameClient:
 
     async def connect(self):
         uri = "ws://localhost:8765"
-        self.websocket = await websockets.connect(uri)
+        self.websocket = await websockets.connect(uri, compression=None)
         logging.info("Connected to the game server.")
         # Initialize Pygame
         self.init_pygame()
@@ -333,76 +398,88 @@ class GuiGameClient:
     async def receive_messages(self):
         try:
             async for message in self.websocket:
-                data = json.loads(message)
-                message_type = data.get("type")
-                if message_type == "state":
-                    self.player_id = data.get("player_id")
-                    payload = data.get("payload")
-                    self.location = payload.get("location")
-                    self.available_exits = payload.get("available_exits")
-                    self.state_data = payload
-                    self.bodies_in_room = set(payload.get("bodies_in_room", []))
-                elif message_type == "movement":
-                    payload = data.get("payload")
-                    player = payload.get("player_id")
-                    from_room = payload.get("from")
-                    to_room = payload.get("to")
-                    if player != self.player_id:
-                        logging.info(
-                            f"Player {player} moved from {from_room} to {to_room}"
-                        )
-                elif message_type == "player_update":
-                    payload = data.get("payload")
-                    player = payload.get("player_id")
-                    event = payload.get("event")
-                    location = payload.get("location")
-                    if player != self.player_id:
-                        logging.info(f"Player {player} {event} in {location}")
-                elif message_type == "error":
-                    payload = data.get("payload")
-                    error_message = payload.get("message")
-                    logging.error(f"Error: {error_message}")
-                elif message_type == "event":
-                    payload = data.get("payload")
-                    event = payload.get("event")
-                    if event == "body_reported":
-                        self.show_murder_notification()
-                        logging.info(
-                            f"Body reported by Player {payload.get('reporter')}"
-                        )
-                    elif event == "player_killed":
-                        logging.info(f"Player {payload.get('victim')} was killed")
-                elif message_type == "phase_update":
-                    payload = data.get("payload")
-                    phase = payload.get("phase")
-                    self.game_phase = phase
-                    if phase == "discussion":
-                        self.show_discussion_phase()
-                    elif phase == "voting":
-                        self.show_voting_phase()
-                    elif phase == "free_roam":
-                        self.hide_phase_overlays()
-                elif message_type == "chat":
-                    # Display chat messages
-                    payload = data.get("payload")
-                    player_id = payload.get("player_id")
-                    message_text = payload.get("message")
-                    self.chat_messages.append(f"[{player_id[:8]}]: {message_text}")
-                elif message_type == "vote_confirmation":
-                    logging.info("Your vote has been recorded.")
-                else:
-                    logging.info("Received unknown message type.")
+                data = loads(message)
+                # Frames queued close together arrive batched as a list
+                for item in data if isinstance(data, list) else [data]:
+                    self.handle_message(item)
         except websockets.exceptions.ConnectionClosed:
             pass  # Handle the connection being closed
         finally:
             self.running = False  # Stop the game loop
 
+    def handle_message(self, data):
+        message_type = data.get("type")
+        if message_type == "state":
+            self.player_id = data.get("player_id")
+            payload = data.get("payload")
+            self.location = payload.get("location")
+            self.available_exits = payload.get("available_exits")
+            self.state_data = payload
+            self.bodies_in_room = set(payload.get("bodies_in_room", []))
+        elif message_type == "state_delta":
+            # Merge the changed fields into the last full state
+            self.state_data.update(data.get("payload"))
+            self.location = self.state_data.get("location")
+            self.available_exits = self.state_data.get("available_exits")
+            self.bodies_in_room = set(self.state_data.get("bodies_in_room", []))
+        elif message_type == "movement":
+            payload = data.get("payload")
+            player = payload.get("player_id")
+            from_room = payload.get("from")
+            to_room = payload.get("to")
+            if player != self.player_id:
+                logging.info(
+                    f"Player {player} moved from {from_room} to {to_room}"
+                )
+        elif message_type == "player_update":
+            payload = data.get("payload")
+            player = payload.get("player_id")
+            event = payload.get("event")
+            location = payload.get("location")
+            if player != self.player_id:
+                logging.info(f"Player {player} {event} in {location}")
+        elif message_type == "error":
+            payload = data.get("payload")
+            error_message = payload.get("message")
+            logging.error(f"Error: {error_message}")
+        elif message_type == "event":
+            payload = data.get("payload")
+            event = payload.get("event")
+            if event == "body_reported":
+                self.show_murder_notification()
+                logging.info(
+                    f"Body reported by Player {payload.get('reporter')}"
+                )
+            elif event == "player_killed":
+                logging.info(f"Player {payload.get('victim')} was killed")
+        elif message_type == "phase_update":
+            payload = data.get("payload")
+            phase = payload.get("phase")
+            self.game_phase = phase
+            if phase == "discussion":
+                self.show_discussion_phase()
+            elif phase == "voting":
+                self.show_voting_phase()
+            elif phase == "free_roam":
+                self.hide_phase_overlays()
+        elif message_type == "chat":
+            # Display chat messages
+            payload = data.get("payload")
+            player_id = payload.get("player_id")
+            message_text = payload.get("message")
+            self.chat_messages.append(f"[{player_id[:8]}]: {message_text}")
+        elif message_type == "vote_confirmation":
+            logging.info("Your vote has been recorded.")
+        else:
+            logging.info("Received unknown message type.")
+
     def init_pygame(self):
         pygame.init()
         self.screen = pygame.display.set_mode((800, 600))
         pygame.display.set_caption("Among Us - Pygame Client")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont(None, 24)
+        self.large_font = pygame.font.SysFont(None, 74)  # Bigger font for dramatic effect
 
     async def game_loop(self):
         while self.running:
@@ -457,26 +534,13 @@ class GuiGameClient:
                 await self.send_move_command(exit_name)
                 return
 
-        # Check player slots
-        if self.state_data:
-            players_in_room = self.state_data.get("players_in_room", {})
-            grid_cols = 3
-            item_width = (self.screen.get_width() - 80) // grid_cols
-            item_height = 40
-            start_y = 70  # Adjust based on your layout
-
-            for i, pid in enumerate(players_in_room.keys()):
-                row = i // grid_cols
-                col = i % grid_cols
-                x = 40 + (col * item_width)
-                y = start_y + (row * (item_height + 5))
-
-                player_rect = pygame.Rect(x, y, item_width - 10, item_height)
-                if player_rect.collidepoint(position):
-                    if pid != self.player_id:
-                        self.selected_player = pid
-                        logging.info(f"Selected Player {pid}")
-                    return
+        # Check player slots, using the rects render drew
+        index = pygame.Rect(position, (1, 1)).collidelist(self.player_hit_rects)
+        if index >= 0:
+            pid = self.player_hit_pids[index]
+            self.selected_player = pid
+            logging.info(f"Selected Player {pid}")
+            return
 
         self.selected_player = None
 
@@ -484,171 +548,250 @@ class GuiGameClient:
         # Update any necessary game state here
         pass
 
-    def render(self):
-        self.screen.fill((0, 0, 0))  # Clear screen with black background
-        self.exit_buttons.clear()  # Clear old exit buttons before adding new ones
-
-        # Constants for layout
-        MARGIN = 20
-        TOP_INFO_HEIGHT = 30
-        PLAYERS_BOX_HEIGHT = 220
-        DESTINATIONS_BOX_HEIGHT = 150
+    def render_text(self, text, color, font=None):
+        """Returns a rendered text surface, reusing it while the same text is still on screen"""
+        font = font or self.font
+        key = (text, color, font)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # Match the display's pixel format once so later blits need no conversion
+            surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = surface
+            if len(self.text_cache) > self.text_cache_size:
+                self.text_cache.popitem(last=False)
+        else:
+            self.text_cache.move_to_end(key)
+        return surface
+
+    def rect_surface(self, size, color, border_color=None, border_width=0):
+        """Returns a surface filled like pygame.draw.rect would, with its border baked in"""
+        key = (size, color, border_color, border_width)
+        surface = self.rect_surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(size).convert()
+            surface.fill(color)
+            if border_color is not None:
+                pygame.draw.rect(surface, border_color, surface.get_rect(), border_width)
+            self.rect_surfaces[key] = surface
+        return surface
+
+    def player_slot(self, index, box_width):
+        """Returns the slot and kill button rects for a grid position; they only move if the box does"""
+        key = (index, box_width)
+        rects = self.slot_rects.get(key)
+        if rects is None:
+            grid_cols = 3
+            item_width = (box_width - 40) // grid_cols
+            item_height = 60  # Increased height to accommodate buttons
+            start_y = self.MARGIN + self.TOP_INFO_HEIGHT + 50
+            row = index // grid_cols
+            col = index % grid_cols
+            x = self.MARGIN + 20 + (col * item_width)
+            y = start_y + (row * (item_height + 5))
+            rects = (
+                pygame.Rect(x, y, item_width - 10, item_height),
+                pygame.Rect(x + 5, y + 30, 60, 20),
+            )
+            self.slot_rects[key] = rects
+        return rects
+
+    def layout_exits(self, screen_size):
+        """Lays out the exit buttons, which only move when the exits or the screen change"""
+        screen_width, screen_height = screen_size
+        BOX_WIDTH = screen_width - (self.MARGIN * 2)
+        dest_box_y = screen_height - self.DESTINATIONS_BOX_HEIGHT - self.MARGIN
+        rect_blits = []
+        text_blits = []
+        self.exit_buttons = {}
+        if self.available_exits:
+            button_width = min(200, (BOX_WIDTH - 40) // len(self.available_exits))
+            button_margin = 10
+            total_buttons_width = (button_width + button_margin) * len(
+                self.available_exits
+            )
+            start_x = (screen_width - total_buttons_width) // 2
+
+            for i, exit_name in enumerate(self.available_exits):
+                x = start_x + (i * (button_width + button_margin))
+                y = dest_box_y + 50
+
+                # Button background
+                button_rect = pygame.Rect(x, y, button_width, 40)
+                rect_blits.append(
+                    (self.rect_surface(button_rect.size, (0, 50, 100), (0, 100, 200), 2), button_rect)
+                )
+
+                # Exit text
+                exit_surface = self.render_text(exit_name, (200, 200, 255))
+                text_rect = exit_surface.get_rect(center=button_rect.center)
+                text_blits.append((exit_surface, text_rect))
+
+                # Store button rect for click detection
+                self.exit_buttons[exit_name] = button_rect
+        return rect_blits, text_blits
+
+    def render_background(self):
+        """Draws the boxes, titles and info bar, which only change with location, role or status"""
+        MARGIN = self.MARGIN
+        TOP_INFO_HEIGHT = self.TOP_INFO_HEIGHT
         BOX_WIDTH = self.screen.get_width() - (MARGIN * 2)
+        background = pygame.Surface(self.screen.get_size()).convert()
+        background.fill((0, 0, 0))  # Clear screen with black background
 
         # Draw top info bar (role and status)
         if self.state_data:
             role = self.state_data.get("role", "Unknown")
             status = self.state_data.get("status", "Unknown")
             info_text = f"Role: {role} | Status: {status}"
-            info_surface = self.font.render(info_text, True, (255, 255, 255))
-            self.screen.blit(info_surface, (MARGIN, MARGIN))
+            info_surface = self.render_text(info_text, (255, 255, 255))
+            background.blit(info_surface, (MARGIN, MARGIN))
 
         # Draw Players Box
         players_box_rect = pygame.Rect(
-            MARGIN, MARGIN + TOP_INFO_HEIGHT, BOX_WIDTH, PLAYERS_BOX_HEIGHT
+            MARGIN, MARGIN + TOP_INFO_HEIGHT, BOX_WIDTH, self.PLAYERS_BOX_HEIGHT
         )
-        pygame.draw.rect(self.screen, (40, 40, 40), players_box_rect)
-        pygame.draw.rect(self.screen, (100, 100, 100), players_box_rect, 2)
+        pygame.draw.rect(background, (40, 40, 40), players_box_rect)
+        pygame.draw.rect(background, (100, 100, 100), players_box_rect, 2)
 
         # Players box title
-        title = self.font.render(
-            f"Players in {self.location or 'Unknown'}", True, (200, 200, 200)
+        title = self.render_text(
+            f"Players in {self.location or 'Unknown'}", (200, 200, 200)
+        )
+        background.blit(title, (MARGIN + 10, MARGIN + TOP_INFO_HEIGHT + 10))
+
+        # Draw Destinations Box
+        dest_box_y = self.screen.get_height() - self.DESTINATIONS_BOX_HEIGHT - MARGIN
+        dest_box_rect = pygame.Rect(
+            MARGIN, dest_box_y, BOX_WIDTH, self.DESTINATIONS_BOX_HEIGHT
         )
-        self.screen.blit(title, (MARGIN + 10, MARGIN + TOP_INFO_HEIGHT + 10))
+        pygame.draw.rect(background, (40, 40, 40), dest_box_rect)
+        pygame.draw.rect(background, (100, 100, 100), dest_box_rect, 2)
+
+        # Destinations title
+        dest_title = self.render_text("Available Destinations", (200, 200, 200))
+        background.blit(dest_title, (MARGIN + 10, dest_box_y + 10))
+        return background
+
+    def render(self):
+        MARGIN = self.MARGIN
+        TOP_INFO_HEIGHT = self.TOP_INFO_HEIGHT
+        screen = self.screen
+        screen_size = screen.get_size()
+        screen_width, screen_height = screen_size
+        BOX_WIDTH = screen_width - (MARGIN * 2)
+
+        # Read the state once per frame rather than once per player
+        state_data = self.state_data
+        role = state_data.get("role")
+        status = state_data.get("status")
+        can_kill = role == "Impostor" and status == "alive"
+
+        # One blit of the cached chrome instead of redrawing it every frame
+        background_key = (self.location, role, status, screen_size)
+        if background_key != self.background_key:
+            self.background = self.render_background()
+            self.background_key = background_key
+        screen.blit(self.background, (0, 0))
+        # Slot and button backgrounds, then their labels, are each drawn in one blits call
+        rect_blits = []
+        text_blits = []
 
         # Display players in a grid with action buttons
-        if self.state_data:
-            players_in_room = self.state_data.get("players_in_room", {})
-            grid_cols = 3
-            item_width = (BOX_WIDTH - 40) // grid_cols
-            item_height = 60  # Increased height to accommodate buttons
-            start_y = MARGIN + TOP_INFO_HEIGHT + 50
+        if state_data:
+            players_in_room = state_data.get("players_in_room", {})
 
             self.action_buttons.clear()  # Clear old action buttons
+            self.player_hit_rects.clear()
+            self.player_hit_pids.clear()
 
             for i, (pid, data) in enumerate(players_in_room.items()):
                 if pid == self.player_id:
                     continue  # Skip rendering buttons for self
 
-                row = i // grid_cols
-                col = i % grid_cols
-                x = MARGIN + 20 + (col * item_width)
-                y = start_y + (row * (item_height + 5))
-
                 # Player slot background
-                player_rect = pygame.Rect(x, y, item_width - 10, item_height)
+                player_rect, kill_button = self.player_slot(i, BOX_WIDTH)
+                self.player_hit_rects.append(player_rect)
+                self.player_hit_pids.append(pid)
                 bg_color = (70, 70, 70) if pid == self.selected_player else (50, 50, 50)
-                pygame.draw.rect(self.screen, bg_color, player_rect)
-                pygame.draw.rect(self.screen, (100, 100, 100), player_rect, 1)
+                rect_blits.append(
+                    (self.rect_surface(player_rect.size, bg_color, (100, 100, 100), 1), player_rect)
+                )
 
                 # Player text
                 player_text = f"Player {pid[:8]}"
-                text_color = (
-                    (100, 255, 100) if data["status"] == "alive" else (255, 100, 100)
-                )
-                player_surface = self.font.render(player_text, True, text_color)
+                alive = data["status"] == "alive"
+                text_color = (100, 255, 100) if alive else (255, 100, 100)
+                player_surface = self.render_text(player_text, text_color)
                 text_rect = player_surface.get_rect(
-                    midleft=(x + 5, y + 15)  # Adjusted y position
+                    midleft=(player_rect.x + 5, player_rect.y + 15)  # Adjusted y position
                 )
-                self.screen.blit(player_surface, text_rect)
+                text_blits.append((player_surface, text_rect))
 
                 # Add action buttons if conditions are met
-                if (
-                    data["status"] == "alive"
-                    and self.state_data.get("role") == "Impostor"
-                    and self.state_data.get("status") == "alive"
-                ):
-                    kill_button = pygame.Rect(x + 5, y + 30, 60, 20)
-                    pygame.draw.rect(self.screen, (200, 0, 0), kill_button)
-                    kill_text = self.font.render("Kill", True, (255, 255, 255))
+                if alive and can_kill:
+                    rect_blits.append((self.rect_surface(kill_button.size, (200, 0, 0)), kill_button))
+                    kill_text = self.render_text("Kill", (255, 255, 255))
                     kill_text_rect = kill_text.get_rect(center=kill_button.center)
-                    self.screen.blit(kill_text, kill_text_rect)
+                    text_blits.append((kill_text, kill_text_rect))
                     self.action_buttons[("kill", pid)] = kill_button
 
         # Only show report button if there are bodies in the current room
-        if self.state_data:
-            bodies_in_room = self.state_data.get("bodies_in_room", [])
-            if bodies_in_room and self.state_data.get("status") == "alive":
+        if state_data:
+            bodies_in_room = state_data.get("bodies_in_room", [])
+            if bodies_in_room and status == "alive":
                 report_button = pygame.Rect(
-                    self.screen.get_width() - 150,
+                    screen_width - 150,
                     MARGIN + TOP_INFO_HEIGHT + 10,
                     100,
                     30,
                 )
-                pygame.draw.rect(self.screen, (255, 0, 0), report_button)
-                report_text = self.font.render("REPORT", True, (255, 255, 255))
+                rect_blits.append((self.rect_surface(report_button.size, (255, 0, 0)), report_button))
+                report_text = self.render_text("REPORT", (255, 255, 255))
                 report_text_rect = report_text.get_rect(center=report_button.center)
-                self.screen.blit(report_text, report_text_rect)
+                text_blits.append((report_text, report_text_rect))
                 self.action_buttons[("report", None)] = report_button
 
-        # Draw Destinations Box
-        dest_box_y = self.screen.get_height() - DESTINATIONS_BOX_HEIGHT - MARGIN
-        dest_box_rect = pygame.Rect(
-            MARGIN, dest_box_y, BOX_WIDTH, DESTINATIONS_BOX_HEIGHT
-        )
-        pygame.draw.rect(self.screen, (40, 40, 40), dest_box_rect)
-        pygame.draw.rect(self.screen, (100, 100, 100), dest_box_rect, 2)
-
-        # Destinations title
-        dest_title = self.font.render("Available Destinations", True, (200, 200, 200))
-        self.screen.blit(dest_title, (MARGIN + 10, dest_box_y + 10))
-
         # Display available exits as buttons
-        if self.available_exits:
-            button_width = min(200, (BOX_WIDTH - 40) // len(self.available_exits))
-            button_margin = 10
-            total_buttons_width = (button_width + button_margin) * len(
-                self.available_exits
-            )
-            start_x = (self.screen.get_width() - total_buttons_width) // 2
-
-            for i, exit_name in enumerate(self.available_exits):
-                x = start_x + (i * (button_width + button_margin))
-                y = dest_box_y + 50
+        exit_layout_key = (tuple(self.available_exits or ()), screen_size)
+        if exit_layout_key != self.exit_layout_key:
+            self.exit_blits = self.layout_exits(screen_size)
+            self.exit_layout_key = exit_layout_key
+        exit_rect_blits, exit_text_blits = self.exit_blits
+        rect_blits.extend(exit_rect_blits)
+        text_blits.extend(exit_text_blits)
 
-                # Button background
-                button_rect = pygame.Rect(x, y, button_width, 40)
-                pygame.draw.rect(self.screen, (0, 50, 100), button_rect)
-                pygame.draw.rect(self.screen, (0, 100, 200), button_rect, 2)
-
-                # Exit text
-                exit_surface = self.font.render(exit_name, True, (200, 200, 255))
-                text_rect = exit_surface.get_rect(center=button_rect.center)
-                self.screen.blit(exit_surface, text_rect)
-
-                # Store button rect for click detection
-                self.exit_buttons[exit_name] = button_rect
+        screen.blits(rect_blits, doreturn=False)
+        screen.blits(text_blits, doreturn=False)
 
         # Draw murder overlay if active
         current_time = pygame.time.get_ticks()
         if self.show_murder_overlay:
             if current_time - self.murder_overlay_start < self.MURDER_OVERLAY_DURATION:
                 # Create semi-transparent overlay
-                overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
+                overlay = pygame.Surface(screen_size)
                 overlay.fill((200, 0, 0))  # Red background
                 overlay.set_alpha(128)  # Semi-transparent
-                self.screen.blit(overlay, (0, 0))
+                screen.blit(overlay, (0, 0))
                 
                 # Create large text
-                large_font = pygame.font.SysFont(None, 74)  # Bigger font for dramatic effect
-                text = large_font.render("THERE HAS BEEN A MURDER!!", True, (255, 255, 255))
-                text_rect = text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
+                text = self.render_text("THERE HAS BEEN A MURDER!!", (255, 255, 255), self.large_font)
+                text_rect = text.get_rect(center=(screen_width // 2, screen_height // 2))
                 
                 # Add shadow effect for better visibility
-                shadow = large_font.render("THERE HAS BEEN A MURDER!!", True, (0, 0, 0))
+                shadow = self.render_text("THERE HAS BEEN A MURDER!!", (0, 0, 0), self.large_font)
                 shadow_rect = shadow.get_rect(center=(text_rect.centerx + 2, text_rect.centery + 2))
-                self.screen.blit(shadow, shadow_rect)
-                self.screen.blit(text, text_rect)
+                screen.blit(shadow, shadow_rect)
+                screen.blit(text, text_rect)
             else:
                 self.show_murder_overlay = False
 
-        # Display help hint
+        # Display help hint, last so it stays on top of the overlay
         help_text = "Press H for help"
-        help_surface = self.font.render(help_text, True, (150, 150, 150))
+        help_surface = self.render_text(help_text, (150, 150, 150))
         help_rect = help_surface.get_rect(
-            bottomright=(self.screen.get_width() - MARGIN, self.screen.get_height() - 5)
+            bottomright=(screen_width - MARGIN, screen_height - 5)
         )
-        self.screen.blit(help_surface, help_rect)
+        screen.blit(help_surface, help_rect)
 
         pygame.display.flip()
 
@@ -666,7 +809,7 @@ class GuiGameClient:
         ]
         y_offset = 200
         for line in help_text_lines:
-            help_surface = self.font.render(line, True, (255, 255, 255))
+            help_surface = self.render_text(line, (255, 255, 255))
             self.screen.blit(help_surface, (50, y_offset))
             y_offset += 30
 
@@ -696,31 +839,16 @@ class GuiGameClient:
         if self.player_id is None:
             logging.info("You are not connected to the server yet.")
             return
-        action_message = {
-            "type": "action",
-            "payload": {"action": "move", "destination": destination},
-            "player_id": self.player_id,
-        }
-        await self.websocket.send(json.dumps(action_message))
+        await self.websocket.send(encode_action(self.player_id, "move", "destination", destination))
 
     async def send_kill_command(self, target_id):
         if target_id:
-            action_message = {
-                "type": "action",
-                "payload": {"action": "kill", "target": target_id},
-                "player_id": self.player_id,
-            }
-            await self.websocket.send(json.dumps(action_message))
+            await self.websocket.send(encode_action(self.player_id, "kill", "target", target_id))
         else:
             logging.info("No player selected to kill.")
 
     async def send_report_command(self):
-        action_message = {
-            "type": "action",
-            "payload": {"action": "report"},
-            "player_id": self.player_id,
-        }
-        await self.websocket.send(json.dumps(action_message))
+        await self.websocket.send(encode_action(self.player_id, "report"))
 
     async def disconnect(self):
         self.running = False
@@ -760,25 +888,54 @@ class GuiGameClient:
         pygame.draw.rect(self.screen, (0, 0, 0), (10, 10, self.screen.get_width() - 20, 30), 2)
         pygame.draw.rect(self.screen, (255, 255, 255), (10, 10, self.screen.get_width() - 20, 30), 2)
 
+def configure_logging(server=False):
+    """Configures logging once per process; only the server writes game_server.log."""
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    handlers = [logging.StreamHandler()]
+    if server:
+        handlers.insert(0, logging.FileHandler("game_server.log"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    if server:
+        # The event loop only enqueues records; a listener thread does the file and console I/O
+        listener = logging.handlers.QueueListener(queue.SimpleQueue(), *handlers)
+        queue_handler = logging.handlers.QueueHandler(listener.queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))  # the listener's handlers add the rest
+        handlers = [queue_handler]
+        listener.start()
+        atexit.register(listener.stop)
+    logging.basicConfig(level=logging.INFO, handlers=handlers)
+
+
+def run(main):
+    """Runs a coroutine on uvloop when it is installed, else the default loop."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
 def start_gui_client():
+    configure_logging()
     client = GuiGameClient()
     try:
-        asyncio.run(client.connect())
+        run(client.connect())
     except KeyboardInterrupt:
         print("\nClient closed.")
         sys.exit()
 
 
 def start_server():
+    configure_logging(server=True)
     game_server = GameServer()
 
-    asyncio.run(game_server.start_server())
+    run(game_server.start_server())
 
 
 def start_cli_client():
+    configure_logging()
     client = CliGameClient()
     try:
-        asyncio.run(client.connect())
+        run(client.connect())
     except KeyboardInterrupt:
         print("\nClient closed.")
 
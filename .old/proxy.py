@@ -1,7 +1,6 @@
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
-import json
 import websockets
 import logging
 
@@ -28,20 +27,28 @@ class GameProxy:
 
     async def connect_to_game_server(self, client_ws: WebSocket):
         try:
-            async with websockets.connect(self.game_server_uri) as game_ws:
+            # Frames are forwarded untouched, so skip compression and size checks
+            async with websockets.connect(
+                self.game_server_uri, compression=None, max_size=None
+            ) as game_ws:
                 # Store both WebSocket connections
                 self.clients[client_ws] = game_ws
 
                 # Create tasks for bidirectional message forwarding
                 client_to_game = asyncio.create_task(
-                    self.forward_messages(client_ws, game_ws)
+                    self.forward_client_to_game(client_ws, game_ws)
                 )
                 game_to_client = asyncio.create_task(
-                    self.forward_messages(game_ws, client_ws)
+                    self.forward_game_to_client(game_ws, client_ws)
                 )
 
-                # Wait for either connection to close
-                await asyncio.gather(client_to_game, game_to_client)
+                # Wait for either direction to close, then tear down the other
+                done, pending = await asyncio.wait(
+                    [client_to_game, game_to_client],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in pending:
+                    task.cancel()
 
         except websockets.exceptions.ConnectionClosed:
             logger.info("Connection to game server closed")
@@ -51,10 +58,28 @@ class GameProxy:
             if client_ws in self.clients:
                 del self.clients[client_ws]
 
-    async def forward_messages(self, source_ws, target_ws):
+    async def forward_client_to_game(self, client_ws: WebSocket, game_ws):
+        try:
+            while True:
+                # Raw ASGI message: no JSON parsing and no extra text decode
+                message = await client_ws.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                data = message.get("bytes")
+                await game_ws.send(data if data is not None else message["text"])
+        except websockets.exceptions.ConnectionClosed:
+            logger.info("WebSocket connection closed")
+        except Exception as e:
+            logger.error(f"Error forwarding message: {str(e)}")
+
+    async def forward_game_to_client(self, game_ws, client_ws: WebSocket):
         try:
-            async for message in source_ws:
-                await target_ws.send(message)
+            async for message in game_ws:
+                # Preserve the frame type chosen by the game server
+                if isinstance(message, bytes):
+                    await client_ws.send_bytes(message)
+                else:
+                    await client_ws.send_text(message)
         except websockets.exceptions.ConnectionClosed:
             logger.info("WebSocket connection closed")
         except Exception as e:
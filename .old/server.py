@@ -2,18 +2,24 @@
 
 import asyncio
 import websockets
-import uuid
-import json
+try:
+    import orjson
+    dumps, loads = orjson.dumps, orjson.loads
+except ImportError:  # fall back to the stdlib codec
+    import json
+    loads = json.loads
+    _encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def dumps(obj):
+        # Match orjson: compact, and bytes so frames can be batched and sent as binary
+        return _encode(obj).encode()
 import logging
-import fire
 import random
-
-import pygame
-import sys
-from typing import Dict, Optional, Any, Callable, List
+import socket
+import itertools
 from collections import defaultdict
-from dataclasses import dataclass, field, asdict
-import time
+from dataclasses import dataclass
+from typing import Any
 
 
 # Event types constants
@@ -35,15 +41,65 @@ class GameEvents:
     VOTE_CONFIRMATION = "vote_confirmation"
 
 
+# Shared default for adjacency lookups on unknown rooms
+NO_EXITS = frozenset()
+
+# Identical for every recipient, so these are encoded once at import
+VOTE_CONFIRMATION_FRAME = dumps({
+    "type": "vote_confirmation",
+    "payload": {
+        "message": "Vote received."
+    }
+})
+GAME_STARTED_FRAME = dumps({
+    "type": "game_update",
+    "payload": {"event": GameEvents.GAME_STARTED},
+})
+GAME_IN_PROGRESS_FRAME = dumps({
+    "type": "error",
+    "payload": {
+        "message": "Game already in progress. Please wait."
+    },
+})
+
+
+@dataclass
+class Player:
+    """A connected player's socket, room and outbound queue"""
+    # Spelled out rather than slots=True, which needs Python 3.10; the image runs 3.9
+    __slots__ = ("websocket", "location", "outbox", "writer", "error_frames")
+
+    websocket: Any
+    location: str
+    outbox: asyncio.Queue
+    writer: asyncio.Task
+    error_frames: dict  # error text -> encoded error for this player
+
+
 class GameServer:
     def __init__(self):
-        self.players = {}  # key: player_id, value: dict with 'websocket' and 'location'
+        self.players = {}  # player_id -> Player
+        self.room_members = defaultdict(set)  # location -> player_ids in that room
+        self.player_ids = itertools.count(1)  # Source of unique player ids
+        self.last_state = {}  # player_id -> state payload last sent, for deltas
+        self.room_players_cache = {}  # location -> players_in_room, until the room changes
+        self.room_delta_frames = {}  # location -> encoded players_in_room delta, likewise
+        self.stale_states = set()  # player_ids whose state is sent at the next flush
+        self.state_flush = None  # Pending loop callback that sends stale states
+        # Free-roam action -> coroutine taking (player_id, payload)
+        self.action_handlers = {
+            "move": lambda pid, payload: self.handle_move(pid, payload["destination"]),
+            "kill": lambda pid, payload: self.handle_kill(pid, payload.get("target")),
+            "report": lambda pid, payload: self.handle_report(pid),
+            "call_meeting": lambda pid, payload: self.handle_emergency_meeting(pid),
+        }
         self.map_structure = self.initialize_map()
+        self.adjacency = {k: frozenset(v) for k, v in self.map_structure.items()}  # For O(1) move checks
         self.roles = {}  # player_id -> role
         self.player_status = {}  # player_id -> "alive" or "dead"
         self.bodies = {}  # player_id -> location
+        self.bodies_by_location = defaultdict(set)  # location -> player_ids of bodies there
         self.PROXIMITY_RADIUS = "same_room"  # Bodies can only be reported in same room
-        self.setup_logging()
         self.exit_buttons = {}  # Store button rectangles for click detection
         self.game_started = False
         self.current_phase = "free_roam"
@@ -52,13 +108,9 @@ class GameServer:
         self.votes = {}             # player_id -> voted_player_id or "skip"
         self.emergency_meetings = {}  # player_id -> number of meetings called
         self.max_emergency_meetings = 1  # Configurable max number of meetings per player
-
-    def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler("game_server.log"), logging.StreamHandler()],
-        )
+        self.outbox_size = 64  # Frames queued per player before the oldest is dropped
+        self.send_timeout = 5.0  # Seconds a single send may stall before the player is dropped
+        self.send_batch_window = 0.001  # Seconds to gather frames into one batched send
 
     def initialize_map(self):
         return {
@@ -74,29 +126,41 @@ class GameServer:
         }
 
     def generate_unique_id(self):
-        return str(uuid.uuid4())
+        # Ids only need to be unique within this process; str keeps them valid JSON keys
+        return str(next(self.player_ids))
 
     async def handle_connection(self, websocket, path):
         if self.game_started:
-            await websocket.send(
-                json.dumps(
-                    {
-                        "type": "error",
-                        "payload": {
-                            "message": "Game already in progress. Please wait."
-                        },
-                    }
-                )
-            )
+            await websocket.send(GAME_IN_PROGRESS_FRAME)
             return
 
+        # Frames are tiny and latency-sensitive; don't let Nagle hold them back
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass  # Best-effort; a closed socket or non-TCP transport is served untuned
+
         player_id = self.generate_unique_id()
         initial_location = "cafeteria"
-        self.players[player_id] = {"websocket": websocket, "location": initial_location}
+        outbox = asyncio.Queue(maxsize=self.outbox_size)
+        self.players[player_id] = Player(
+            websocket=websocket,
+            location=initial_location,
+            outbox=outbox,
+            writer=asyncio.create_task(self.write_messages(websocket, outbox)),
+            error_frames={},
+        )
+        self.room_members[initial_location].add(player_id)
+        self.invalidate_rooms(initial_location)
         self.player_status[player_id] = "alive"
 
+        # The newcomer's snapshot goes first; the room update below then has no delta for them
+        self.write_state(player_id)
+
         # Broadcast new player connection
-        await self.broadcast_message(
+        self.broadcast_message(
             {
                 "type": "player_update",
                 "payload": {
@@ -108,39 +172,37 @@ class GameServer:
         )
 
         # Update state for all players in the initial room
-        await self.update_room_players(initial_location)
+        self.update_room_players(initial_location)
 
         # Check if we should start the game and assign roles
         if len(self.players) >= 6 and not self.game_started:
             self.assign_roles()
             self.game_started = True
-            logging.info("Game started with {} players".format(len(self.players)))
+            logging.info("Game started with %d players", len(self.players))
             # Broadcast game start
-            await self.broadcast_message(
-                {
-                    "type": "game_update",
-                    "payload": {"event": GameEvents.GAME_STARTED},
-                }
-            )
+            self.broadcast_frame(GAME_STARTED_FRAME)
 
-        logging.info(f"Player {player_id} connected.")
+        logging.info("Player %s connected.", player_id)
         try:
-            await self.send_state_update(player_id)
             async for message in websocket:
                 await self.process_message(message, player_id)
         except websockets.exceptions.ConnectionClosedError:
-            logging.warning(f"Connection closed unexpectedly for player {player_id}.")
+            logging.warning("Connection closed unexpectedly for player %s.", player_id)
         finally:
             # Broadcast player disconnection before cleanup
-            current_location = self.players[player_id]["location"]
+            current_location = self.players[player_id].location
+            self.players[player_id].writer.cancel()
 
             if player_id in self.roles:
                 del self.roles[player_id]
             if player_id in self.player_status:
                 del self.player_status[player_id]
             del self.players[player_id]
+            self.last_state.pop(player_id, None)
+            self.room_members[current_location].discard(player_id)
+            self.invalidate_rooms(current_location)
 
-            await self.broadcast_message(
+            self.broadcast_message(
                 {
                     "type": "player_update",
                     "payload": {
@@ -152,9 +214,9 @@ class GameServer:
             )
 
             # Update state for players in the room where disconnection occurred
-            await self.update_room_players(current_location)
+            self.update_room_players(current_location)
 
-            logging.info(f"Player {player_id} disconnected.")
+            logging.info("Player %s disconnected.", player_id)
 
     def assign_roles(self):
         # Check if there are enough players
@@ -170,6 +232,7 @@ class GameServer:
 
         # Clear existing roles before reassigning
         self.roles.clear()
+        self.invalidate_rooms(*self.map_structure)
 
         # Assign roles to all players
         for player_id in player_ids:
@@ -177,12 +240,12 @@ class GameServer:
             self.roles[player_id] = role
             
             # Send individual role update to each player
-            asyncio.create_task(self.send_state_update(player_id))
+            self.send_state_update(player_id)
 
-        logging.info(f"Roles assigned. Impostors: {impostor_ids}")
+        logging.info("Roles assigned. Impostors: %s", impostor_ids)
 
     async def process_message(self, message, player_id):
-        data = json.loads(message)
+        data = loads(message)
         if data["type"] == "action":
             action = data["payload"]["action"]
             if self.current_phase == "discussion":
@@ -194,35 +257,32 @@ class GameServer:
                     voted_player = data["payload"]["vote"]
                     await self.handle_vote(player_id, voted_player)
             else:
+                # One alive check covers every handler in action_handlers
                 if self.player_status.get(player_id) != "alive":
-                    await self.send_error(player_id, "You are dead and cannot perform actions.")
+                    self.send_error(player_id, "You are dead and cannot perform actions.")
                     return
-                if action == "move":
-                    destination = data["payload"]["destination"]
-                    await self.handle_move(player_id, destination)
-                elif action == "kill":
-                    target_id = data["payload"].get("target")
-                    await self.handle_kill(player_id, target_id)
-                elif action == "report":
-                    await self.handle_report(player_id)
-                elif action == "call_meeting":
-                    await self.handle_emergency_meeting(player_id)
+                handler = self.action_handlers.get(action)
+                if handler is None:
+                    self.send_error(player_id, "Invalid action.")
                 else:
-                    await self.send_error(player_id, "Invalid action.")
+                    await handler(player_id, data["payload"])
 
     def validate_move(self, current_location, destination):
-        return destination in self.map_structure.get(current_location, [])
+        return destination in self.adjacency.get(current_location, NO_EXITS)
 
     async def handle_move(self, player_id, destination):
-        if self.player_status.get(player_id) != "alive":
-            await self.send_error(player_id, "You are dead and cannot move.")
-            return
-        current_location = self.players[player_id]["location"]
-        if self.validate_move(current_location, destination):
-            self.players[player_id]["location"] = destination
+        player = self.players[player_id]
+        current_location = player.location
+        # Same check as validate_move, inlined on the hot path
+        if destination in self.adjacency.get(current_location, NO_EXITS):
+            room_members = self.room_members
+            player.location = destination
+            room_members[current_location].discard(player_id)
+            room_members[destination].add(player_id)
+            self.invalidate_rooms(current_location, destination)
 
             # Broadcast movement to all players
-            await self.broadcast_message({
+            self.broadcast_message({
                 "type": "movement",
                 "payload": {
                     "player_id": player_id,
@@ -232,38 +292,36 @@ class GameServer:
             })
 
             # Send individual state updates to affected rooms' players
-            await self.update_room_players(current_location)  # Update players in the old room
-            await self.update_room_players(destination)  # Update players in the new room
+            self.update_room_players(current_location, destination)
 
-            logging.info(f"Player {player_id} moved to {destination}.")
+            logging.info("Player %s moved to %s.", player_id, destination)
         else:
-            await self.send_error(player_id, "Invalid move")
+            self.send_error(player_id, "Invalid move")
 
-    async def update_room_players(self, room_name):
-        """Send state updates to all players in a specific room"""
-        for pid, player_data in self.players.items():
-            if player_data["location"] == room_name:
-                await self.send_state_update(pid)
+    def update_room_players(self, *room_names):
+        """Send state updates to all players in the given rooms"""
+        for pid in set().union(*(self.room_members[room] for room in room_names)):
+            self.send_state_update(pid)
 
     async def handle_kill(self, killer_id, target_id):
         if not target_id:
-            await self.send_error(killer_id, "No target specified for kill action.")
+            self.send_error(killer_id, "No target specified for kill action.")
             return
         if not self.validate_kill(killer_id, target_id):
-            await self.send_error(killer_id, "Invalid kill attempt")
+            self.send_error(killer_id, "Invalid kill attempt")
             return
 
         self.player_status[target_id] = "dead"
-        location = self.players[target_id]["location"]
+        location = self.players[target_id].location
         self.bodies[target_id] = location
+        self.bodies_by_location[location].add(target_id)
+        self.invalidate_rooms(location)
 
         # Update all players in the room where the kill occurred
-        for pid, player_data in self.players.items():
-            if player_data["location"] == location:
-                await self.send_state_update(pid)
+        self.update_room_players(location)
 
         # Notify others in the room
-        await self.broadcast_message({
+        self.broadcast_message({
             "type": "event",
             "payload": {
                 "event": GameEvents.PLAYER_KILLED,
@@ -278,28 +336,24 @@ class GameServer:
             self.roles.get(killer_id) == "Impostor"
             and self.player_status.get(killer_id) == "alive"
             and self.player_status.get(target_id) == "alive"
-            and self.players[killer_id]["location"]
-            == self.players[target_id]["location"]
+            and self.players[killer_id].location
+            == self.players[target_id].location
         )
 
     async def handle_report(self, reporter_id):
         if not self.validate_report(reporter_id):
-            await self.send_error(reporter_id, "No bodies nearby to report")
+            self.send_error(reporter_id, "No bodies nearby to report")
             return
 
         # Get all bodies in reporter's room
-        reporter_location = self.players[reporter_id]["location"]
-        reported_bodies = [
-            body_id
-            for body_id, location in self.bodies.items()
-            if location == reporter_location
-        ]
+        reporter_location = self.players[reporter_id].location
+        reported_bodies = sorted(self.bodies_by_location.pop(reporter_location, ()))
 
         # Remove bodies from the game after reporting
         for body_id in reported_bodies:
             del self.bodies[body_id]
 
-        await self.broadcast_message(
+        self.broadcast_message(
             {
                 "type": "event",
                 "payload": {
@@ -320,69 +374,143 @@ class GameServer:
             return False
 
         # Check if there are any bodies in the same room
-        reporter_location = self.players[reporter_id]["location"]
-        return any(
-            location == reporter_location for body_id, location in self.bodies.items()
-        )
+        return bool(self.bodies_by_location.get(self.players[reporter_id].location))
 
-    async def broadcast_message(self, message, alive_only=False):
-        for player_id, player in self.players.items():
+    async def write_messages(self, websocket, outbox):
+        """Drains one player's outbox onto their socket; the only task that sends to it"""
+        try:
+            while True:
+                batch = [await outbox.get()]
+                # Give handlers a moment to queue more, then send them all as one JSON array
+                await asyncio.sleep(self.send_batch_window)
+                while not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                payload = batch[0] if len(batch) == 1 else b"[" + b",".join(batch) + b"]"
+                await asyncio.wait_for(websocket.send(payload), self.send_timeout)
+        except asyncio.TimeoutError:
+            # Closing ends the player's receive loop, whose cleanup removes them
+            logging.warning("Dropping a player whose socket stalled for %ss.", self.send_timeout)
+            await websocket.close(code=1008, reason="Send timed out")
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    def send_to(self, player_id, payload, snapshot=False):
+        """Queues a serialized frame for a player, dropping their oldest if they lag"""
+        outbox = self.players[player_id].outbox
+        if outbox.full():
+            outbox.get_nowait()
+            if not snapshot:
+                # The dropped frame may have been a state, so resync with a full one next;
+                # send_state_update only schedules it, so this never re-enters a full queue.
+                # A snapshot being queued is that resync already.
+                self.last_state.pop(player_id, None)
+                self.send_state_update(player_id)
+        outbox.put_nowait(payload)
+
+    def broadcast_message(self, message, alive_only=False):
+        self.broadcast_frame(dumps(message), alive_only)  # Encode once for every recipient
+
+    def broadcast_frame(self, payload, alive_only=False):
+        for player_id in self.players:
             if alive_only and self.player_status.get(player_id) != "alive":
                 continue
-            await player["websocket"].send(json.dumps(message))
-
-    async def send_state_update(self, player_id):
-        location = self.players[player_id]["location"]
+            self.send_to(player_id, payload)
+
+    def send_state_update(self, player_id):
+        """Marks a player's state stale; several changes in one loop iteration send one update"""
+        self.stale_states.add(player_id)
+        if self.state_flush is None:
+            self.state_flush = asyncio.get_running_loop().call_soon(self.flush_states)
+
+    def flush_states(self):
+        self.state_flush = None
+        stale_states, self.stale_states = self.stale_states, set()
+        for player_id in stale_states:
+            if player_id in self.players:  # They may have left since
+                self.write_state(player_id)
+
+    def write_state(self, player_id):
+        location = self.players[player_id].location
         if self.player_status.get(player_id) != "alive":
             available_exits = []
-            exits_status = {}
         else:
             available_exits = self.map_structure.get(location, [])
-            exits_status = {
-                exit: "available" for exit in available_exits  # All exits are now always available
-            }
 
         # Get bodies in current room
-        bodies_in_room = [
-            body_id for body_id, body_loc in self.bodies.items() if body_loc == location
-        ]
-
-        state_message = {
-            "type": "state",
-            "payload": {
-                "location": location,
-                "players_in_room": self.get_players_in_room(location),
-                "available_exits": available_exits,
-                "exits_status": exits_status,
-                "role": self.roles.get(player_id),
-                "status": self.player_status.get(player_id),
-                "bodies_in_room": bodies_in_room,
-            },
-            "player_id": player_id,
+        bodies_in_room = sorted(self.bodies_by_location.get(location, ()))
+
+        payload = {
+            "location": location,
+            "players_in_room": self.get_players_in_room(location),
+            "available_exits": available_exits,
+            "role": self.roles.get(player_id),
+            "status": self.player_status.get(player_id),
+            "bodies_in_room": bodies_in_room,
         }
-        await self.players[player_id]["websocket"].send(json.dumps(state_message))
+        last_state = self.last_state.get(player_id)
+        self.last_state[player_id] = payload
+        if last_state is None:
+            # Full snapshot on connect or after frames were dropped
+            state_message = {"type": "state", "payload": payload, "player_id": player_id}
+        else:
+            delta = {k: v for k, v in payload.items() if last_state.get(k) != v}
+            if not delta:
+                return
+            if delta.keys() == {"players_in_room"}:
+                # Someone entered or left; every occupant gets the same frame, so encode it once
+                frame = self.room_delta_frames.get(location)
+                if frame is None:
+                    frame = dumps({"type": "state_delta", "payload": delta})
+                    self.room_delta_frames[location] = frame
+                self.send_to(player_id, frame)
+                return
+            state_message = {"type": "state_delta", "payload": delta}
+        self.send_to(player_id, dumps(state_message), snapshot=last_state is None)
+
+    def invalidate_rooms(self, *locations):
+        """Forgets cached occupant data for rooms whose occupants or their status changed"""
+        for location in locations:
+            self.room_players_cache.pop(location, None)
+            self.room_delta_frames.pop(location, None)
 
     def get_players_in_room(self, location):
-        return {
-            pid: {
-                "status": self.player_status[pid],
-                "role": self.roles.get(pid, "unknown"),
+        """Returns the living players in a room, rebuilt only after the room changes"""
+        players = self.room_players_cache.get(location)
+        if players is None:
+            players = {
+                pid: {
+                    "status": self.player_status[pid],
+                    "role": self.roles.get(pid, "unknown"),
+                }
+                for pid in self.room_members[location]
+                if self.player_status.get(pid) == "alive"
             }
-            for pid, data in self.players.items()
-            if data["location"] == location and self.player_status.get(pid) == "alive"
-        }
-
-    async def send_error(self, player_id, message):
-        error_message = {
-            "type": "error",
-            "payload": {"message": message},
-            "player_id": player_id,
-        }
-        websocket = self.players[player_id]["websocket"]
-        await websocket.send(json.dumps(error_message))
+            self.room_players_cache[location] = players
+        return players
+
+    def send_error(self, player_id, message):
+        # Error texts are a small fixed set, so each is encoded once per player
+        error_frames = self.players[player_id].error_frames
+        frame = error_frames.get(message)
+        if frame is None:
+            error_message = {
+                "type": "error",
+                "payload": {"message": message},
+                "player_id": player_id,
+            }
+            frame = error_frames[message] = dumps(error_message)
+        self.send_to(player_id, frame)
 
     async def start_server(self):
-        server = await websockets.serve(self.handle_connection, "localhost", 8765)
+        server = await websockets.serve(
+            self.handle_connection,
+            "localhost",
+            8765,
+            compression=None,
+            max_size=2**14,
+            max_queue=64,
+            write_limit=2**20,  # Absorb broadcast bursts instead of stalling on drain
+        )
         logging.info("Server started on ws://localhost:8765")
         await server.wait_closed()
 
@@ -390,7 +518,7 @@ class GameServer:
         self.current_phase = "discussion"
         self.votes.clear()
         # Notify all players about the discussion phase
-        await self.broadcast_message({
+        self.broadcast_message({
             "type": "phase_update",
             "payload": {
                 "phase": "discussion",
@@ -405,7 +533,7 @@ class GameServer:
     async def start_voting_phase(self):
         self.current_phase = "voting"
         # Notify all players about the voting phase
-        await self.broadcast_message({
+        self.broadcast_message({
             "type": "phase_update",
             "payload": {
                 "phase": "voting",
@@ -418,7 +546,7 @@ class GameServer:
         await self.tally_votes()
         # Return to free roam phase
         self.current_phase = "free_roam"
-        await self.broadcast_message({
+        self.broadcast_message({
             "type": "phase_update",
             "payload": {
                 "phase": "free_roam"
@@ -427,10 +555,10 @@ class GameServer:
 
     async def handle_chat(self, player_id, message_text):
         if self.player_status.get(player_id) != "alive":
-            await self.send_error(player_id, "Dead players cannot chat.")
+            self.send_error(player_id, "Dead players cannot chat.")
             return
         # Broadcast chat message to all alive players
-        await self.broadcast_message({
+        self.broadcast_message({
             "type": "chat",
             "payload": {
                 "player_id": player_id,
@@ -440,21 +568,16 @@ class GameServer:
 
     async def handle_vote(self, player_id, voted_player):
         if self.player_status.get(player_id) != "alive":
-            await self.send_error(player_id, "Dead players cannot vote.")
+            self.send_error(player_id, "Dead players cannot vote.")
             return
         if player_id in self.votes:
-            await self.send_error(player_id, "You have already voted.")
+            self.send_error(player_id, "You have already voted.")
             return
         if voted_player not in self.players and voted_player != "skip":
-            await self.send_error(player_id, "Invalid vote.")
+            self.send_error(player_id, "Invalid vote.")
             return
         self.votes[player_id] = voted_player
-        await self.players[player_id]["websocket"].send(json.dumps({
-            "type": "vote_confirmation",
-            "payload": {
-                "message": "Vote received."
-            }
-        }))
+        self.send_to(player_id, VOTE_CONFIRMATION_FRAME)
 
     async def tally_votes(self):
         vote_counts = {}
@@ -466,7 +589,8 @@ class GameServer:
             if len(candidates) == 1 and candidates[0] != "skip":
                 ejected_player = candidates[0]
                 self.player_status[ejected_player] = "dead"
-                await self.broadcast_message({
+                self.invalidate_rooms(*self.map_structure)
+                self.broadcast_message({
                     "type": "event",
                     "payload": {
                         "event": GameEvents.PLAYER_VOTED,
@@ -476,7 +600,7 @@ class GameServer:
                 })
             else:
                 # Tie or majority chose to skip
-                await self.broadcast_message({
+                self.broadcast_message({
                     "type": "event",
                     "payload": {
                         "event": "no_ejection",
@@ -485,7 +609,7 @@ class GameServer:
                 })
         else:
             # No votes cast
-            await self.broadcast_message({
+            self.broadcast_message({
                 "type": "event",
                 "payload": {
                     "event": "no_ejection",
@@ -494,12 +618,9 @@ class GameServer:
             })
 
     async def handle_emergency_meeting(self, player_id):
-        if self.player_status.get(player_id) != "alive":
-            await self.send_error(player_id, "Dead players cannot call meetings.")
-            return
         meetings_called = self.emergency_meetings.get(player_id, 0)
         if meetings_called >= self.max_emergency_meetings:
-            await self.send_error(player_id, "No emergency meetings left.")
+            self.send_error(player_id, "No emergency meetings left.")
             return
         self.emergency_meetings[player_id] = meetings_called + 1
         await self.start_discussion_phase()
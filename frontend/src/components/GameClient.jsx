@@ -18,18 +18,31 @@ const GameClient = () => {
   const [emergencyMeetingsLeft, setEmergencyMeetingsLeft] = useState(1);
   const [timeLeft, setTimeLeft] = useState(0);
   const timerRef = useRef(null);
+  const wsRef = useRef(null);
+  const stateSeqRef = useRef(0);
+  const awaitingSyncRef = useRef(false);
 
   useEffect(() => {
     const websocket = new WebSocket('ws://localhost:8765');
+    // The server sends orjson-encoded binary frames
+    websocket.binaryType = 'arraybuffer';
+    const decoder = new TextDecoder();
     setWs(websocket);
+    wsRef.current = websocket;
 
     websocket.onopen = () => {
       console.log('WebSocket connection established');
     };
 
     websocket.onmessage = (event) => {
-      const message = JSON.parse(event.data);
-      handleMessage(message);
+      const text = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+      const message = JSON.parse(text);
+      // Messages sent close together arrive batched as an array
+      if (Array.isArray(message)) {
+        message.forEach(handleMessage);
+      } else {
+        handleMessage(message);
+      }
     };
 
     websocket.onclose = () => {
@@ -44,6 +57,18 @@ const GameClient = () => {
     };
   }, []);
 
+  // Applies whichever state fields are present; used for snapshots and deltas
+  const applyState = (fields) => {
+    if ('location' in fields) setLocation(fields.location);
+    if ('available_exits' in fields) setAvailableExits(fields.available_exits);
+    if ('players_in_room' in fields) setPlayersInRoom(fields.players_in_room);
+    if ('role' in fields) setRole(fields.role);
+    if ('status' in fields) setStatus(fields.status);
+    if ('bodies_in_room' in fields) setBodiesInRoom(fields.bodies_in_room);
+    if ('alive_players' in fields) setAlivePlayers(fields.alive_players);
+    if ('emergency_meetings_left' in fields) setEmergencyMeetingsLeft(fields.emergency_meetings_left);
+  };
+
   const handleMessage = (message) => {
     console.log('Received message:', message);
     
@@ -62,14 +87,21 @@ const GameClient = () => {
         case 'state_update':
           // Update player state
           if (!playerId) setPlayerId(message.player_id);
-          setLocation(message.location);
-          setAvailableExits(message.available_exits);
-          setPlayersInRoom(message.players_in_room);
-          setRole(message.role);
-          setStatus(message.status);
-          setBodiesInRoom(message.bodies_in_room);
-          setAlivePlayers(message.alive_players);
-          setEmergencyMeetingsLeft(message.emergency_meetings_left);
+          if ('seq' in message) stateSeqRef.current = message.seq;
+          awaitingSyncRef.current = false;
+          applyState(message);
+          break;
+        case 'state_delta':
+          // The requested snapshot supersedes any delta that arrives before it
+          if (awaitingSyncRef.current) break;
+          if (message.seq !== stateSeqRef.current + 1) {
+            // Missed a delta; ask the server for a fresh snapshot, once
+            awaitingSyncRef.current = true;
+            wsRef.current.send(JSON.stringify({ action: 'sync' }));
+            break;
+          }
+          stateSeqRef.current = message.seq;
+          applyState(message.changes);
           break;
         case 'player_moved':
           setMessages((prev) => [
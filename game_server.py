@@ -2,18 +2,38 @@
 
 import asyncio
 import websockets
-import json
+import orjson
 import logging
 import random
-from collections import defaultdict
+import socket
+from collections import Counter, defaultdict
 from pydantic import BaseModel
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from dataclasses import dataclass, field
-from pydantic import ValidationError
 from enum import Enum
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 # Simplified Game Server for an Among Us-like game with an event-based architecture
 
+# Required fields and their types for each client action; anything else is rejected
+ACTION_FIELDS = {
+    "move": {"destination": str},
+    "kill": {"target": str},
+    "report": {},
+    "vote": {"vote": str},
+    "call_meeting": {},
+    "chat": {"message": str},
+    "task": {"task_name": str},
+    "sync": {},
+}
+
+# Messages with no per-player fields, encoded once at import
+VOTE_RECEIVED_FRAME = orjson.dumps({"type": "vote_received"})
+
 PLAYER_NAMES = ["Alice", "Bob", "Charlie", "Dave", "Eve", "Mallory", "Trent", "Frank", "Grace", "Henry", "Ivy", "Jack", "Kelly", "Luna", "Max", "Nina", "Oscar", "Penny", "Quinn", "Ruby", "Sam"]
 
 
@@ -96,8 +116,8 @@ class Task(BaseModel):
         return False
 
 
-from typing import Any
-class Player(BaseModel):
+@dataclass(slots=True)
+class Player:
     """Represents a player in the game."""
     id: str
     websocket: Any
@@ -108,6 +128,10 @@ class Player(BaseModel):
     tasks: Optional[Dict[str, Task]] = None
     active_task: Optional[str] = None
     movement_locked: bool = False  # Added movement_locked attribute
+    outbox: Any = None  # asyncio.Queue of serialized messages awaiting send
+    writer_task: Any = None  # Task draining outbox onto the websocket
+    last_state: Optional[dict] = None  # Last state sent, for delta encoding
+    state_seq: int = 0  # Sequence number of the last state message sent
 
     def assign_tasks(self):
         if self.role == PlayerRole.CREWMATE:
@@ -122,7 +146,13 @@ class GameState:
     """Holds the current state of the game."""
     players: Dict[str, Player] = field(default_factory=dict)
     bodies: Dict[str, str] = field(default_factory=dict)
+    room_occupants: Dict[str, Set[str]] = field(default_factory=dict)
+    bodies_by_room: Dict[str, Set[str]] = field(default_factory=dict)
+    alive_ids: Set[str] = field(default_factory=set)
     map_layout: Dict[str, List[str]] = field(default_factory=dict)
+    adjacency: Dict[str, frozenset] = field(default_factory=dict)
+    exits: Dict[str, tuple] = field(default_factory=dict)
+    room_static_json: Dict[str, bytes] = field(default_factory=dict)
     phase: str = "free_roam"
     votes: Dict[str, str] = field(default_factory=dict)
     game_started: bool = False
@@ -133,6 +163,16 @@ class GameState:
     max_emergency_meetings: int = 1
     completed_tasks: int = 0
     task_tick_interval: int = 5
+    outbox_size: int = 256  # Clients with more unsent messages get dropped
+    send_batch_window: float = 0.001  # Seconds to gather messages into one frame
+    max_message_size: int = 2**14  # Largest client action accepted, in bytes
+    inbox_size: int = 64  # Received frames buffered per client before reads pause
+    socket_buffer_size: int = 1 << 20  # Kernel send/receive buffer per connection
+    ping_interval: float = 60  # Seconds between keepalive pings, so liveness is ~1 min
+    ping_timeout: float = 30  # Seconds to wait for a pong before dropping the client
+    close_timeout: float = 5  # Seconds to wait for the closing handshake
+    write_limit: int = 2**20  # Bytes buffered per connection before sends wait on drain
+    background_tasks: Set[asyncio.Task] = field(default_factory=set)  # Strong refs until done
     logger: logging.Logger = field(init=False)
     disconnected_players: Dict[str, Player] = field(
         default_factory=dict
@@ -141,11 +181,24 @@ class GameState:
     def __post_init__(self):
         self.logger = self.setup_logger()
         self.map_layout = self.initialize_map()
+        # map_layout keeps exit order for display; adjacency is for membership tests
+        self.adjacency = {room: frozenset(exits) for room, exits in self.map_layout.items()}
+        # The map never changes, so each room's fixed fields are encoded once up front
+        self.exits = {room: tuple(exits) for room, exits in self.map_layout.items()}
+        self.room_static_json = {
+            room: orjson.dumps({"location": room, "available_exits": exits})[1:-1]
+            for room, exits in self.exits.items()
+        }
+        # Reverse indexes so room lookups don't scan every player/body
+        self.room_occupants = {room: set() for room in self.map_layout}
+        self.bodies_by_room = {room: set() for room in self.map_layout}
 
     def setup_logger(self):
         """Sets up the logger for the server."""
         logger = logging.getLogger("GameServer")
         logger.setLevel(logging.INFO)
+        if logger.handlers:
+            return logger  # Already configured by an earlier GameState
         handler = logging.StreamHandler()
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -169,21 +222,18 @@ class GameState:
         }
 
 
-class GameEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, PlayerRole):
-            return obj.value
-        if isinstance(obj, Enum):
-            return obj.value
-        return super().default(obj)
-
-
 class GameServer:
     """Main game server class that orchestrates the game."""
 
     def __init__(self):
         self.event_manager = EventManager()
         self.state = GameState()
+        self.dirty_players = set()  # Players owed a state update this tick
+        self.room_state_cache = {}  # Room -> state fields shared by its occupants
+        self.room_state_json_cache = {}  # Room -> those fields as a JSON object body
+        self.error_frames = {}  # Error text -> its encoded error message
+        self.phase_ended = None  # asyncio.Event that ends the current phase timer early
+        self.alive_players_cache = None  # Sorted alive_ids, rebuilt after it changes
         self.setup_event_handlers()
 
     def setup_event_handlers(self):
@@ -196,18 +246,44 @@ class GameServer:
 
     async def start_server(self):
         """Starts the WebSocket server."""
-        server = await websockets.serve(self.handle_connection, "localhost", 8765)
+        # Frames are small JSON; per-message deflate costs more CPU than it saves
+        server = await websockets.serve(
+            self.handle_connection,
+            "localhost",
+            8765,
+            compression=None,
+            max_size=self.state.max_message_size,
+            max_queue=self.state.inbox_size,
+            ping_interval=self.state.ping_interval,
+            ping_timeout=self.state.ping_timeout,
+            close_timeout=self.state.close_timeout,
+            write_limit=self.state.write_limit,
+        )
         self.state.logger.info("Server started on ws://localhost:8765")
         await server.wait_closed()
 
+    def tune_socket(self, websocket):
+        """Disables Nagle and sizes kernel buffers to absorb a burst of frames."""
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.state.socket_buffer_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.state.socket_buffer_size)
+        except OSError as e:
+            # Tuning is best-effort; a socket reset mid-handshake or a non-TCP transport still gets served
+            self.state.logger.debug("Could not tune socket: %s", e)
+
     async def handle_connection(self, websocket, path):
         """Handles a new player connection."""
         player_id = None
+        self.tune_socket(websocket)
         try:
             # Check if server is full
             if len(self.state.players) >= len(PLAYER_NAMES):
                 await websocket.send(
-                    json.dumps({"type": "error", "message": "Server is full"})
+                    orjson.dumps({"type": "error", "message": "Server is full"})
                 )
                 return
 
@@ -225,11 +301,21 @@ class GameServer:
             #     # await self.send_task_list_update(player_id)
             # else:
             if True:
-                player = Player(id=player_id, websocket=websocket)
+                player = Player(
+                    id=player_id,
+                    websocket=websocket,
+                    outbox=asyncio.Queue(maxsize=self.state.outbox_size),
+                )
+                player.writer_task = asyncio.create_task(
+                    self.run_writer(player_id, websocket, player.outbox)
+                )
                 self.state.players[player_id] = player
+                self.state.room_occupants[player.location].add(player_id)
+                self.invalidate_room_state(player.location)
+                self.set_alive(player_id, True)
 
                 # Send initial welcome message
-                await self.send_message(
+                self.send_message(
                     player_id, {"type": "welcome", "player_id": player_id}
                 )
 
@@ -247,9 +333,9 @@ class GameServer:
                     self.assign_roles()
                     self.state.game_started = True
                     self.state.logger.info(
-                        f"Game started with {len(self.state.players)} players."
+                        "Game started with %d players.", len(self.state.players)
                     )
-                    await self.broadcast({"type": "game_started"})
+                    self.broadcast({"type": "game_started"})
 
                     # self.assign_tasks_to_players()
 
@@ -257,33 +343,39 @@ class GameServer:
                     # for pid in self.state.players:
                     #     await self.send_task_list_update(pid)
 
-                self.state.logger.info(f"Player {player_id} connected.")
+                self.state.logger.info("Player %s connected.", player_id)
 
                 # Send initial state update
-                await self.send_state_update(player_id)
+                self.mark_state_dirty(player_id)
 
             # Handle incoming messages
             async for message_str in websocket:
                 try:
-                    message = json.loads(message_str)
-                    action = message.get("action")
-                    if action:
-                        message["player_id"] = player_id  # Include player_id in message
-                        await self.event_manager.dispatch(f"action_{action}", message)
-                    else:
-                        await self.send_error(player_id, "Invalid action.")
-                except json.JSONDecodeError:
-                    await self.send_error(player_id, "Invalid message format.")
+                    message = orjson.loads(message_str)
+                except orjson.JSONDecodeError:
+                    self.send_error(player_id, "Invalid message format.")
+                    continue
+                action = message.get("action") if isinstance(message, dict) else None
+                fields = ACTION_FIELDS.get(action) if isinstance(action, str) else None
+                if fields is None:
+                    self.send_error(player_id, "Invalid action.")
+                    continue
+                if not all(isinstance(message.get(k), t) for k, t in fields.items()):
+                    self.send_error(player_id, "Invalid message format.")
+                    continue
+                message["player_id"] = player_id  # Include player_id in message
+                await self.event_manager.dispatch(f"action_{action}", message)
 
         except websockets.exceptions.ConnectionClosedError:
-            self.state.logger.warning(f"Player {player_id} disconnected unexpectedly.")
+            self.state.logger.warning("Player %s disconnected unexpectedly.", player_id)
         except Exception as e:
-            import traceback
-            self.state.logger.error(
-                f"Error handling connection: {str(e)}\nException type: {type(e).__name__}\nTraceback: {traceback.format_exc()}"
+            # exception() appends the traceback only if the record is emitted
+            self.state.logger.exception(
+                "Error handling connection: %s\nException type: %s", e, type(e).__name__
             )
         finally:
             if player_id in self.state.players:
+                self.state.players[player_id].writer_task.cancel()
                 await self.event_manager.dispatch(
                     "player_disconnected", {"player_id": player_id}
                 )
@@ -294,7 +386,7 @@ class GameServer:
         """Handles a new player connection event."""
         player_id = data["player_id"]
         player = self.state.players[player_id]
-        await self.broadcast(
+        self.broadcast(
             {
                 "type": "player_connected",
                 "player_id": player_id,
@@ -312,14 +404,17 @@ class GameServer:
             # player = self.state.players[player_id]
             # # Store player's tasks in disconnected_players
             # self.state.disconnected_players[player_id] = player
-            del self.state.players[player_id]
-            await self.broadcast(
+            player = self.state.players.pop(player_id)
+            self.state.room_occupants[player.location].discard(player_id)
+            self.invalidate_room_state(player.location)
+            self.set_alive(player_id, False)
+            self.broadcast(
                 {
                     "type": "player_disconnected",
                     "player_id": player_id,
                 }
             )
-            self.state.logger.info(f"Player {player_id} disconnected.")
+            self.state.logger.info("Player %s disconnected.", player_id)
 
     @event("action_move")
     async def on_action_move(self, data):
@@ -328,14 +423,18 @@ class GameServer:
         destination = data.get("destination")
         player = self.state.players[player_id]
         if player.movement_locked:
-            await self.send_error(player_id, "Cannot move while performing a task.")
+            self.send_error(player_id, "Cannot move while performing a task.")
             return
-        if destination in self.state.map_layout.get(player.location, []):
-            old_location = player.location
+        old_location = player.location
+        if destination in self.state.adjacency[old_location]:
+            occupants = self.state.room_occupants
             player.location = destination
+            occupants[old_location].discard(player_id)
+            occupants[destination].add(player_id)
+            self.invalidate_room_state(old_location, destination)
 
             # Broadcast movement to everyone
-            await self.broadcast(
+            self.broadcast(
                 {
                     "type": "player_moved",
                     "player_id": player_id,
@@ -345,11 +444,10 @@ class GameServer:
             )
 
             # Send state updates to all players in both old and new locations
-            for pid, p in self.state.players.items():
-                if p.location in [old_location, destination]:
-                    await self.send_state_update(pid)
+            for pid in occupants[old_location] | occupants[destination]:
+                self.mark_state_dirty(pid)
         else:
-            await self.send_error(player_id, "Invalid move.")
+            self.send_error(player_id, "Invalid move.")
 
     @event("action_kill")
     async def on_action_kill(self, data):
@@ -367,8 +465,11 @@ class GameServer:
             and killer.location == target.location
         ):
             target.is_alive = False
+            self.set_alive(target_id, False)
             self.state.bodies[target_id] = target.location
-            await self.broadcast(
+            self.state.bodies_by_room[target.location].add(target_id)
+            self.invalidate_room_state(target.location)
+            self.broadcast(
                 {
                     "type": "player_killed",
                     "killer": killer_id,
@@ -376,9 +477,9 @@ class GameServer:
                     "location": target.location,
                 }
             )
-            await self.send_state_update(target_id)
+            self.mark_state_dirty(target_id)
         else:
-            await self.send_error(killer_id, "Invalid kill attempt.")
+            self.send_error(killer_id, "Invalid kill attempt.")
 
     @event("action_report")
     async def on_action_report(self, data):
@@ -386,10 +487,10 @@ class GameServer:
         reporter_id = data["player_id"]
         reporter = self.state.players[reporter_id]
         location = reporter.location
-        if any(body_loc == location for body_loc in self.state.bodies.values()):
+        if self.state.bodies_by_room[location]:
             await self.start_discussion_phase()
         else:
-            await self.send_error(reporter_id, "No bodies to report here.")
+            self.send_error(reporter_id, "No bodies to report here.")
 
     @event("action_vote")
     async def on_action_vote(self, data):
@@ -398,13 +499,12 @@ class GameServer:
         voted_player = data.get("vote")
         if player_id not in self.state.votes:
             self.state.votes[player_id] = voted_player
-            await self.send_message(player_id, {"type": "vote_received"})
-            if len(self.state.votes) >= len(
-                [p for p in self.state.players.values() if p.is_alive]
-            ):
-                await self.tally_votes()
+            self.send_payload(player_id, VOTE_RECEIVED_FRAME)
+            # Everyone has voted, so there's no reason to wait out the timer
+            if self.all_votes_in() and self.phase_ended is not None:
+                self.phase_ended.set()
         else:
-            await self.send_error(player_id, "You have already voted.")
+            self.send_error(player_id, "You have already voted.")
 
     @event("action_call_meeting")
     async def on_action_call_meeting(self, data):
@@ -418,7 +518,7 @@ class GameServer:
             player.emergency_meetings_left -= 1
 
             # Send notification about who called the meeting
-            await self.broadcast({
+            self.broadcast({
                 "type": "emergency_meeting_called",
                 "player_id": player_id
             })
@@ -426,7 +526,14 @@ class GameServer:
             # Start discussion phase
             await self.start_discussion_phase()
         else:
-            await self.send_error(player_id, "No emergency meetings left.")
+            self.send_error(player_id, "No emergency meetings left.")
+
+    @event("action_sync")
+    async def on_action_sync(self, data):
+        """Resends a full state snapshot, e.g. after the client saw a sequence gap."""
+        player_id = data["player_id"]
+        self.state.players[player_id].last_state = None
+        self.mark_state_dirty(player_id)
 
     @event("action_chat")
     async def on_action_chat(self, data):
@@ -444,30 +551,33 @@ class GameServer:
                     "player_id": player_id,
                     "message": message_text,
                 }
-                # Only send ghost messages to dead players
-                for pid, p in self.state.players.items():
-                    if not p.is_alive:
-                        await self.send_message(pid, ghost_message)
+                # Serialize once, then only send ghost messages to dead players
+                ghost_payload = orjson.dumps(ghost_message)
+                for pid in self.state.players.keys() - self.state.alive_ids:
+                    self.send_payload(pid, ghost_payload)
             else:
                 # Living players' messages go to everyone but without ghost tag
-                await self.broadcast({
+                self.broadcast({
                     "type": "chat_message",
                     "player_id": player_id,
                     "message": message_text,
                 })
         else:
-            await self.send_error(player_id, "Cannot chat now.")
+            self.send_error(player_id, "Cannot chat now.")
 
     # Helper methods
     def assign_roles(self):
         """Randomly assigns roles to players at the start of the game."""
         player_ids = list(self.state.players.keys())
         impostor_count = max(1, int(len(player_ids) * self.state.impostor_ratio))
-        impostor_ids = random.sample(player_ids, impostor_count)
-        for player_id in player_ids:
+        # Partial Fisher-Yates: only the first impostor_count slots need shuffling
+        for i in range(impostor_count):
+            j = random.randrange(i, len(player_ids))
+            player_ids[i], player_ids[j] = player_ids[j], player_ids[i]
+        for i, player_id in enumerate(player_ids):
             player = self.state.players[player_id]
-            player.role = PlayerRole.IMPOSTOR if player_id in impostor_ids else PlayerRole.CREWMATE
-            asyncio.create_task(self.send_state_update(player_id))
+            player.role = PlayerRole.IMPOSTOR if i < impostor_count else PlayerRole.CREWMATE
+            self.mark_state_dirty(player_id)
 
     async def start_discussion_phase(self):
         """Initiates the discussion phase after a body is reported or a meeting is called."""
@@ -478,67 +588,79 @@ class GameServer:
         for player_id, player in self.state.players.items():
             await self.interrupt_player_task(player_id, reason="discussion")
 
-        # Send state updates without waiting
+        # Shared across every recipient, so only build it once
+        alive_players = self.get_alive_players()
+
+        # Sends only enqueue onto each player's outbox, so no per-player task is needed
         for player_id, player in self.state.players.items():
             location = player.location
             message = {
                 "type": "phase_change",
                 "phase": "discussion",
                 "duration": self.state.discussion_duration,
-                # Include all state data
-                "location": location,
-                "players_in_room": [pid for pid, p in self.state.players.items() if p.location == location],
-                "available_exits": self.state.map_layout.get(location, []),
+                # Include all state data; room fields are spliced in pre-encoded
                 "role": player.role,
                 "status": "alive" if player.is_alive else "dead",
-                "bodies_in_room": [pid for pid, loc in self.state.bodies.items() if loc == location],
-                "alive_players": [pid for pid, p in self.state.players.items() if p.is_alive],
+                "alive_players": alive_players,
                 "emergency_meetings_left": player.emergency_meetings_left,
             }
-            asyncio.create_task(self.send_message(player_id, message))
+            self.send_payload(
+                player_id, self.encode_with_room_state(message, location)
+            )
 
         # Start phase timer in a separate task
         asyncio.create_task(self.run_discussion_timer())
 
     async def run_discussion_timer(self):
         """Runs the discussion phase timer in a separate task."""
-        await asyncio.sleep(self.state.discussion_duration)
+        await self.wait_for_phase_end(self.state.discussion_duration)
         await self.start_voting_phase()
 
     async def start_voting_phase(self):
         """Initiates the voting phase after the discussion phase ends."""
         self.state.phase = "voting"
-        await self.broadcast(
+        self.broadcast(
             {
                 "type": "phase_change",
                 "phase": "voting",
                 "duration": self.state.voting_duration,
             }
         )
-        await asyncio.sleep(self.state.voting_duration)
+        await self.wait_for_phase_end(self.state.voting_duration)
         await self.tally_votes()
         self.state.phase = "free_roam"
 
+    async def wait_for_phase_end(self, duration: float):
+        """Waits out a phase timer, returning early once every living player has voted."""
+        self.phase_ended = asyncio.Event()
+        if self.all_votes_in():
+            return
+        try:
+            await asyncio.wait_for(self.phase_ended.wait(), timeout=duration)
+        except asyncio.TimeoutError:
+            pass
+
+    def all_votes_in(self) -> bool:
+        """Returns whether every living player has cast a vote."""
+        return len(self.state.votes) >= len(self.state.alive_ids)
+
     async def tally_votes(self):
         """Tallies votes and processes ejection if necessary."""
-        vote_counts = {}
-        for vote in self.state.votes.values():
-            vote_counts[vote] = vote_counts.get(vote, 0) + 1
-
-        if vote_counts:
-            max_votes = max(vote_counts.values())
-            # select all players with max votes... wait, there could be a tie?
-            candidates = [
-                pid for pid, count in vote_counts.items() if count == max_votes 
-            ]
-
-            if len(candidates) == 1 and candidates[0] != "skip":
+        # The top two counts are enough to tell a clear winner from a tie
+        top_votes = Counter(self.state.votes.values()).most_common(2)
+
+        if top_votes:
+            (leader, max_votes), *runner_up = top_votes
+            is_tie = bool(runner_up) and runner_up[0][1] == max_votes
+
+            if not is_tie and leader != "skip":
                 # Interrupt ejected player's task if any
-                ejected_player_id = candidates[0]
+                ejected_player_id = leader
                 await self.interrupt_player_task(ejected_player_id, reason="death")
                 ejected_player = self.state.players[ejected_player_id]
                 ejected_player.is_alive = False
-                await self.broadcast(
+                self.set_alive(ejected_player_id, False)
+                self.broadcast(
                     {
                         "type": "player_ejected",
                         "player_id": ejected_player_id,
@@ -546,77 +668,164 @@ class GameServer:
                     }
                 )
             else:
-                await self.broadcast(
+                self.broadcast(
                     {"type": "no_ejection", "message": "No one was ejected."}
                 )
         else:
-            await self.broadcast({"type": "no_ejection", "message": "No votes cast."})
+            self.broadcast({"type": "no_ejection", "message": "No votes cast."})
         self.state.votes.clear()
 
-    async def send_state_update(self, player_id):
-        """Sends the current game state to a specific player."""
+    def mark_state_dirty(self, player_id: str):
+        """Schedules a state update for a player, coalesced with any others this tick."""
+        if not self.dirty_players:
+            # A plain callback: nothing to keep a reference to, and errors reach the loop's handler
+            asyncio.get_running_loop().call_soon(self.flush_state_updates)
+        self.dirty_players.add(player_id)
+
+    def flush_state_updates(self):
+        """Sends a single state update to each player marked dirty since the last flush."""
+        dirty_players, self.dirty_players = self.dirty_players, set()
+        players = self.state.players
+        for player_id in dirty_players:
+            if player_id in players:
+                self.send_state_update(player_id)
+
+    def get_room_state(self, location: str) -> dict:
+        """Returns the state fields shared by everyone in a room, built once per change."""
+        room_state = self.room_state_cache.get(location)
+        if room_state is None:
+            # Sorted so the same occupants always produce the same list for deltas
+            room_state = {
+                "location": location,
+                "players_in_room": sorted(self.state.room_occupants[location]),
+                "available_exits": self.state.exits[location],
+                "bodies_in_room": sorted(self.state.bodies_by_room[location]),
+            }
+            self.room_state_cache[location] = room_state
+        return room_state
+
+    def encode_with_room_state(self, message: dict, location: str) -> bytes:
+        """Serializes message with the room's shared state, reusing its cached JSON."""
+        room_json = self.room_state_json_cache.get(location)
+        if room_json is None:
+            room_state = self.get_room_state(location)
+            # Strip the braces so the fields can be spliced into another object
+            room_json = orjson.dumps({
+                "players_in_room": room_state["players_in_room"],
+                "bodies_in_room": room_state["bodies_in_room"],
+            })[1:-1] + b"," + self.state.room_static_json[location]
+            self.room_state_json_cache[location] = room_json
+        return orjson.dumps(message)[:-1] + b"," + room_json + b"}"
+
+    def get_alive_players(self) -> List[str]:
+        """Returns the sorted ids of living players, rebuilt only after deaths or joins."""
+        if self.alive_players_cache is None:
+            self.alive_players_cache = sorted(self.state.alive_ids)
+        return self.alive_players_cache
+
+    def set_alive(self, player_id: str, alive: bool):
+        """Keeps alive_ids in step with a player joining, dying or leaving."""
+        if alive:
+            self.state.alive_ids.add(player_id)
+        else:
+            self.state.alive_ids.discard(player_id)
+        self.alive_players_cache = None
+
+    def invalidate_room_state(self, *locations: str):
+        """Drops cached room state after occupants or bodies in those rooms change."""
+        for location in locations:
+            self.room_state_cache.pop(location, None)
+            self.room_state_json_cache.pop(location, None)
+
+    def send_state_update(self, player_id):
+        """Sends the player's state, as a delta against what they last received."""
         player = self.state.players[player_id]
         location = player.location
-        available_exits = self.state.map_layout.get(location, [])
-        players_in_room = [
-            pid for pid, p in self.state.players.items() if p.location == location
-        ]
-        bodies_in_room = [
-            pid for pid, loc in self.state.bodies.items() if loc == location
-        ]
-        alive_players = [pid for pid, p in self.state.players.items() if p.is_alive]
-        state = {
-            "type": "state_update",
-            "location": location,
-            "players_in_room": players_in_room,
-            "available_exits": available_exits,
+        player_state = {
             "role": player.role,
             "status": "alive" if player.is_alive else "dead",
-            "bodies_in_room": bodies_in_room,
-            "alive_players": alive_players,
+            "alive_players": self.get_alive_players(),
             "emergency_meetings_left": player.emergency_meetings_left,
         }
-        await self.send_message(player_id, state)
+        state = {**self.get_room_state(location), **player_state}
+        last_state = player.last_state
+        player.last_state = state
+        if last_state is None:
+            # Full snapshot on connect or after a resync request
+            player.state_seq += 1
+            message = {"type": "state_update", "seq": player.state_seq, **player_state}
+            self.send_payload(
+                player_id, self.encode_with_room_state(message, location)
+            )
+            return
+        changes = {k: v for k, v in state.items() if last_state.get(k) != v}
+        if changes:
+            player.state_seq += 1
+            message = {"type": "state_delta", "seq": player.state_seq, "changes": changes}
+            self.send_message(player_id, message)
 
-    async def send_error(self, player_id, message):
+    def send_error(self, player_id, message):
         """Sends an error message to a specific player."""
-        await self.send_message(player_id, {"type": "error", "message": message})
-
-    async def send_message(self, player_id: str, message_dict: dict):
+        # Error texts are a small fixed set, so each is only encoded once
+        payload = self.error_frames.get(message)
+        if payload is None:
+            payload = orjson.dumps({"type": "error", "message": message})
+            self.error_frames[message] = payload
+        self.send_payload(player_id, payload)
+
+    def send_message(self, player_id: str, message_dict: dict):
         """Sends a message to a specific player."""
+        self.send_payload(player_id, orjson.dumps(message_dict))
+
+    def send_payload(self, player_id: str, payload: bytes):
+        """Queues an already-serialized message for a specific player."""
         player = self.state.players[player_id]
+        outbox = player.outbox
+        if outbox is None:
+            return  # Connection is already being dropped
         try:
-            await player.websocket.send(json.dumps(message_dict, cls=GameEncoder))
-        except websockets.exceptions.ConnectionClosedError:
+            outbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.state.logger.warning(
+                "Outbound queue full for %s; dropping slow client.", player_id
+            )
+            player.outbox = None
+            player.writer_task.cancel()
+            # The loop only holds tasks weakly, so keep the close alive until it finishes
+            close_task = asyncio.create_task(player.websocket.close(1008, "Client too slow"))
+            self.state.background_tasks.add(close_task)
+            close_task.add_done_callback(self.state.background_tasks.discard)
+
+    async def run_writer(self, player_id: str, websocket, outbox: asyncio.Queue):
+        """Drains a player's outbound queue onto their websocket.
+
+        Messages queued within send_batch_window of each other are sent as a
+        single frame holding a JSON array of messages.
+        """
+        try:
+            while True:
+                batch = [await outbox.get()]
+                if self.state.send_batch_window:
+                    await asyncio.sleep(self.state.send_batch_window)
+                while not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                if len(batch) == 1:
+                    await websocket.send(batch[0])
+                else:
+                    await websocket.send(b"[" + b",".join(batch) + b"]")
+        except websockets.exceptions.ConnectionClosed:
             self.state.logger.warning(
-                f"Could not send message to {player_id}; connection closed."
+                "Could not send message to %s; connection closed.", player_id
             )
         except Exception as e:
-            self.state.logger.error(f"Error sending message to {player_id}: {str(e)}")
+            self.state.logger.error("Error sending message to %s: %s", player_id, e)
 
-    async def broadcast(self, message):
+    def broadcast(self, message):
         """Broadcasts a message to all connected players."""
-        message_str = json.dumps(message, cls=GameEncoder)
-        disconnected_players = []
-
-        players_copy = dict(self.state.players)
-
-        for player_id, player in players_copy.items():
-            try:
-                await player.websocket.send(message_str)
-            except websockets.exceptions.ConnectionClosedError:
-                disconnected_players.append(player_id)
-                self.state.logger.warning(
-                    f"Player {player_id} disconnected during broadcast"
-                )
-            except Exception as e:
-                self.state.logger.error(f"Error broadcasting to {player_id}: {str(e)}")
-
-        # Remove disconnected players
-        for player_id in disconnected_players:
-            await self.event_manager.dispatch(
-                "player_disconnected", {"player_id": player_id}
-            )
+        # Serialize once and reuse the same bytes for every recipient
+        message_bytes = orjson.dumps(message)
+        for player_id in list(self.state.players):
+            self.send_payload(player_id, message_bytes)
 
     async def send_task_list_update(self, player_id: str):
         """Sends the task list update to the player."""
@@ -638,7 +847,7 @@ class GameServer:
             "tasks": tasks_list,
             "global_progress": global_progress,
         }
-        await self.send_message(player_id, message)
+        self.send_message(player_id, message)
 
     def calculate_global_progress(self) -> float:
         """Calculates the global task completion progress."""
@@ -669,7 +878,7 @@ class GameServer:
 
         valid, reason = self.validate_task_start(player_id, task_name)
         if not valid:
-            await self.send_error(player_id, reason)
+            self.send_error(player_id, reason)
             return
 
         # Start the task
@@ -677,14 +886,14 @@ class GameServer:
         task = player.tasks[task_name]
         started = task.start()
         if not started:
-            await self.send_error(player_id, "Task could not be started")
+            self.send_error(player_id, "Task could not be started")
             return
 
         player.active_task = task_name
         player.movement_locked = True  # Prevent movement
 
         # Send task_started message to player
-        await self.send_message(
+        self.send_message(
             player_id,
             {
                 "type": "task_started",
@@ -694,7 +903,7 @@ class GameServer:
         )
 
         # Broadcast task_progress with status="started"
-        await self.broadcast(
+        self.broadcast(
             {
                 "type": "task_progress",
                 "player_id": player_id,
@@ -724,7 +933,7 @@ class GameServer:
             "tasks": tasks_list,
             "global_progress": global_progress,
         }
-        await self.send_message(player_id, message)
+        self.send_message(player_id, message)
 
     def validate_task_start(self, player_id: str, task_name: str) -> tuple[bool, str]:
         """Validates if a player can start a task."""
@@ -754,7 +963,7 @@ class GameServer:
                 player.movement_locked = False
                 player.active_task = None
                 # Send task_interrupted message to player
-                await self.send_message(
+                self.send_message(
                     player_id,
                     {
                         "type": "task_interrupted",
@@ -780,7 +989,7 @@ class GameServer:
                 task = player.tasks[task_name]
                 task_completed = task.tick()
                 # Send task_progress message to player
-                await self.send_message(
+                self.send_message(
                     player_id,
                     {
                         "type": "task_progress",
@@ -794,7 +1003,7 @@ class GameServer:
                     player.active_task = None
                     global_progress = self.calculate_global_progress()
                     # Broadcast task_complete message to all players
-                    await self.broadcast(
+                    self.broadcast(
                         {
                             "type": "task_complete",
                             "player_id": player_id,
@@ -804,7 +1013,7 @@ class GameServer:
                     )
                     # Check for crew victory
                     if global_progress >= 1.0:
-                        await self.broadcast({"type": "crew_victory"})
+                        self.broadcast({"type": "crew_victory"})
                         # End the game (not implemented here)
                     else:
                         # Update task list display
@@ -817,4 +1026,7 @@ class GameServer:
 
 if __name__ == "__main__":
     server = GameServer()
-    asyncio.run(server.start_server())
+    if uvloop is not None:
+        uvloop.run(server.start_server())
+    else:
+        asyncio.run(server.start_server())
@@ -10,7 +10,7 @@ fi
 
 # Install Python dependencies
 echo "Installing Python dependencies..."
-pip install websockets python-multipart asyncio fastapi uvicorn watchdog
+pip install websockets orjson uvloop python-multipart asyncio fastapi uvicorn watchdog
 
 # Install frontend dependencies if node_modules doesn't exist
 if [ ! -d "frontend/node_modules" ]; then
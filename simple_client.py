@@ -2,14 +2,32 @@
 
 import asyncio
 import websockets
-import json
+try:
+    import orjson
+    dumps, loads = orjson.dumps, orjson.loads
+except ImportError:  # fall back to the stdlib codec
+    import json
+    loads = json.loads
+    _encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def dumps(obj):
+        # Match orjson: compact, and bytes so frames go out as binary like the server's
+        return _encode(obj).encode()
 import sys
+import threading
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
 
 my_player_id = None  # Global variable to store your player ID
+current_state = {}  # Latest known state, patched by state_delta messages
+awaiting_sync = False  # A sync was requested; deltas are ignored until the snapshot arrives
 
 async def game_client():
     uri = "ws://localhost:8765"
-    async with websockets.connect(uri) as websocket:
+    async with websockets.connect(uri, compression=None) as websocket:
         print("Connected to the game server.")
 
         # Create tasks for receiving messages and handling user input
@@ -29,14 +47,29 @@ async def game_client():
 async def receive_messages(websocket):
     try:
         async for message in websocket:
-            data = json.loads(message)
-            await handle_server_message(data)
+            data = loads(message)
+            # Messages sent close together arrive batched as a list
+            for item in data if isinstance(data, list) else [data]:
+                await handle_server_message(item, websocket)
     except websockets.exceptions.ConnectionClosed:
         print("Connection closed by the server.")
         sys.exit()
 
-async def handle_server_message(data):
-    global my_player_id
+def print_state(state):
+    # One write per update instead of a print call per line
+    sys.stdout.write(
+        "State Update:\n"
+        f"  Location: {state['location']}\n"
+        f"  Players in room: {', '.join(state['players_in_room'])}\n"
+        f"  Available exits: {', '.join(state['available_exits'])}\n"
+        f"  Role: {state['role']}\n"
+        f"  Status: {state['status']}\n"
+        f"  Bodies in room: {', '.join(state['bodies_in_room'])}\n"
+    )
+    sys.stdout.flush()
+
+async def handle_server_message(data, websocket):
+    global my_player_id, awaiting_sync
     message_type = data.get('type')
     if message_type == "player_connected":
         print(f"Player {data['player_id']} connected at location {data['location']}.")
@@ -48,13 +81,21 @@ async def handle_server_message(data):
         if 'player_id' in data:
             my_player_id = data['player_id']
             print(f"Your player ID is {my_player_id}")
-        print("State Update:")
-        print(f"  Location: {data['location']}")
-        print(f"  Players in room: {', '.join(data['players_in_room'])}")
-        print(f"  Available exits: {', '.join(data['available_exits'])}")
-        print(f"  Role: {data['role']}")
-        print(f"  Status: {data['status']}")
-        print(f"  Bodies in room: {', '.join(data['bodies_in_room'])}")
+        awaiting_sync = False
+        current_state.clear()
+        current_state.update(data)
+        print_state(current_state)
+    elif message_type == "state_delta":
+        if awaiting_sync:
+            return  # The requested snapshot supersedes this delta
+        if data['seq'] != current_state.get('seq', 0) + 1:
+            # Missed a delta; ask the server for a fresh snapshot, once
+            awaiting_sync = True
+            await websocket.send(dumps({"action": "sync"}))
+            return
+        current_state.update(data['changes'])
+        current_state['seq'] = data['seq']
+        print_state(current_state)
     elif message_type == "player_moved":
         print(f"Player {data['player_id']} moved from {data['from']} to {data['to']}.")
     elif message_type == "player_killed":
@@ -74,11 +115,20 @@ async def handle_server_message(data):
     else:
         print(f"Unknown message type: {message_type}")
 
+def read_stdin(loop, queue):
+    # Runs in a daemon thread so the event loop never blocks on the terminal
+    for line in sys.stdin:
+        loop.call_soon_threadsafe(queue.put_nowait, line)
+    loop.call_soon_threadsafe(queue.put_nowait, None)  # EOF
+
 async def user_input_handler(websocket):
-    loop = asyncio.get_event_loop()
+    queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    threading.Thread(target=read_stdin, args=(loop, queue), daemon=True).start()
     while True:
-        # Read user input asynchronously
-        user_input = await loop.run_in_executor(None, sys.stdin.readline)
+        user_input = await queue.get()
+        if user_input is None:
+            return
         user_input = user_input.strip()
         if user_input:
             await process_user_input(user_input, websocket)
@@ -90,38 +140,38 @@ async def process_user_input(user_input, websocket):
             "action": "move",
             "destination": destination
         }
-        await websocket.send(json.dumps(message))
+        await websocket.send(dumps(message))
     elif user_input.startswith("kill "):
         target_id = user_input[5:].strip()
         message = {
             "action": "kill",
             "target": target_id
         }
-        await websocket.send(json.dumps(message))
+        await websocket.send(dumps(message))
     elif user_input == "report":
         message = {
             "action": "report"
         }
-        await websocket.send(json.dumps(message))
+        await websocket.send(dumps(message))
     elif user_input.startswith("vote "):
         voted_player = user_input[5:].strip()
         message = {
             "action": "vote",
             "vote": voted_player
         }
-        await websocket.send(json.dumps(message))
+        await websocket.send(dumps(message))
     elif user_input == "call_meeting":
         message = {
             "action": "call_meeting"
         }
-        await websocket.send(json.dumps(message))
+        await websocket.send(dumps(message))
     elif user_input.startswith("chat "):
         message_text = user_input[5:].strip()
         message = {
             "action": "chat",
             "message": message_text
         }
-        await websocket.send(json.dumps(message))
+        await websocket.send(dumps(message))
     elif user_input == "quit":
         print("Exiting game.")
         await websocket.close()
@@ -137,4 +187,7 @@ async def process_user_input(user_input, websocket):
         print("  quit")
 
 if __name__ == "__main__":
-    asyncio.run(game_client())
+    if uvloop is not None:
+        uvloop.run(game_client())
+    else:
+        asyncio.run(game_client())